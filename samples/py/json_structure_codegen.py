@@ -0,0 +1,261 @@
+# encoding: utf-8
+"""
+json_structure_codegen.py
+
+Compiles a JSON Structure schema into a dedicated Python predicate, in the style of
+is-my-json-valid: the schema is translated once into Python source that checks an
+instance with inline type tests and property lookups, and the source is compiled
+with exec(). Validating an instance then runs straight-line code instead of
+re-reading schema keywords.
+
+The predicate only answers whether an instance is valid; it produces no error
+messages. JSONStructureInstanceValidator uses it as a fast path and falls back to
+its keyword-by-keyword validation, which reports the errors, whenever the predicate
+returns False.
+
+Only a conservative subset of the core specification is compiled: object, array,
+map and any, the primitive types that need no format parsing, local $ref and
+type-$ref pointers, properties, required and additionalProperties. compile_schema
+returns None for any schema that uses something else, including every add-in.
+"""
+
+import io
+import uuid
+from collections.abc import Mapping
+
+CORE_METASCHEMA = "https://json-structure.org/meta/core/v0/#"
+
+# Keywords a compiled schema node may carry. Anything else, even a keyword the core
+# validator ignores, makes the schema unsupported.
+_NODE_KEYWORDS = frozenset((
+    "$schema", "$id", "name", "description", "definitions", "default", "examples",
+    "type", "properties", "required", "additionalProperties", "items", "values"
+))
+
+# Inline expressions for primitive types; {v} is the instance expression.
+_PRIMITIVE_EXPRESSIONS = {
+    "string": "isinstance({v}, str)",
+    "duration": "isinstance({v}, str)",
+    "binary": "isinstance({v}, str)",
+    "uuid": "_is_uuid({v})",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "float8": "isinstance({v}, (int, float))",
+    "float": "isinstance({v}, (int, float))",
+    "double": "isinstance({v}, (int, float))",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "int8": "(isinstance({v}, int) and -128 <= {v} <= 127)",
+    "uint8": "(isinstance({v}, int) and 0 <= {v} <= 255)",
+    "int16": "(isinstance({v}, int) and -32768 <= {v} <= 32767)",
+    "uint16": "(isinstance({v}, int) and 0 <= {v} <= 65535)",
+    "int32": "(isinstance({v}, int) and -2147483648 <= {v} <= 2147483647)",
+    "integer": "(isinstance({v}, int) and -2147483648 <= {v} <= 2147483647)",
+    "uint32": "(isinstance({v}, int) and 0 <= {v} <= 4294967295)",
+    # A dict carrying $uses makes the validator apply or reject add-ins.
+    "any": "(not isinstance({v}, dict) or '$uses' not in {v})",
+}
+
+# Compiled predicates by repr() of the schema; oldest entries are evicted first.
+_COMPILED = {}
+_COMPILED_SIZE = 256
+
+
+def _is_uuid(value):
+    if not isinstance(value, str):
+        return False
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+class _Unsupported(Exception):
+    """Raised while generating code for a schema outside the compiled subset."""
+
+
+class _Generator:
+    """
+    Emits one function per compound schema node. Primitive nodes are inlined into
+    their parent's function; compound nodes are called by name, which also lets
+    recursive $ref structures compile.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.out = io.StringIO()
+        self.namespace = {"_is_uuid": _is_uuid}
+        # id() of a compound node -> name of its function, plus the node itself so
+        # that merged schemas stay alive (and their ids unique) during generation.
+        self.names = {}
+        self.pending = []
+        # id() of a node with a type $ref -> (node, merged schema), so that a
+        # recursive type reference reuses one merged schema and one function.
+        self.merged = {}
+
+    def generate(self):
+        """
+        :return: The name of the function checking the root schema.
+        """
+        root_expression = self.expression(self.root, "v")
+        self.out.write(f"def _check(v):\n    return {root_expression}\n\n")
+        while self.pending:
+            name, node = self.pending.pop()
+            self.emit(name, node)
+        return "_check"
+
+    def resolve(self, ref):
+        """
+        Resolves a local JSON pointer the way the instance validator does.
+        """
+        if not isinstance(ref, str) or not ref.startswith("#"):
+            raise _Unsupported(ref)
+        target = self.root
+        for part in ref.lstrip("#").split("/"):
+            if part == "":
+                continue
+            part = part.replace("~1", "/").replace("~0", "~")
+            if not isinstance(target, Mapping) or part not in target:
+                raise _Unsupported(ref)
+            target = target[part]
+        return target
+
+    def expression(self, node, var):
+        """
+        Returns a Python expression that is true if the value named var is valid
+        against node.
+        """
+        seen = set()
+        while isinstance(node, Mapping) and "$ref" in node:
+            if id(node) in seen:
+                raise _Unsupported("$ref cycle")
+            seen.add(id(node))
+            node = self.resolve(node["$ref"])
+        if not isinstance(node, Mapping) or not _NODE_KEYWORDS.issuperset(node):
+            raise _Unsupported(node)
+        schema_type = node.get("type")
+        if isinstance(schema_type, Mapping):
+            entry = self.merged.get(id(node))
+            if entry is None:
+                entry = (node, self.merge_type_ref(node, schema_type))
+                self.merged[id(node)] = entry
+            node = entry[1]
+            schema_type = node["type"]
+        if not isinstance(schema_type, str):
+            raise _Unsupported(schema_type)
+        if schema_type in _PRIMITIVE_EXPRESSIONS:
+            return _PRIMITIVE_EXPRESSIONS[schema_type].format(v=var)
+        if schema_type not in ("object", "array", "map"):
+            raise _Unsupported(schema_type)
+        entry = self.names.get(id(node))
+        if entry is None:
+            entry = (f"_check_{len(self.names)}", node)
+            self.names[id(node)] = entry
+            self.pending.append(entry)
+        return f"{entry[0]}({var})"
+
+    def merge_type_ref(self, node, type_ref):
+        """
+        Mirrors the validator's handling of "type": {"$ref": ...}: the referenced
+        type and properties are merged under the node's own properties.
+        """
+        if set(type_ref) != {"$ref"}:
+            raise _Unsupported(type_ref)
+        resolved = self.resolve(type_ref["$ref"])
+        if not isinstance(resolved, Mapping):
+            raise _Unsupported(resolved)
+        merged = dict(node)
+        merged["type"] = resolved.get("type")
+        if "properties" in resolved:
+            if not isinstance(resolved["properties"], Mapping):
+                raise _Unsupported(resolved)
+            merged_props = dict(resolved["properties"])
+            merged_props.update(node.get("properties", {}))
+            merged["properties"] = merged_props
+        return merged
+
+    def constant(self, value):
+        """
+        Binds value in the generated module's namespace and returns its name.
+        """
+        name = f"_const_{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def emit(self, name, node):
+        out = self.out
+        out.write(f"def {name}(v):\n")
+        schema_type = node["type"]
+        if schema_type == "array":
+            out.write("    if not isinstance(v, list):\n        return False\n")
+            items = node.get("items")
+            if items:
+                out.write(f"    for x in v:\n        if not {self.expression(items, 'x')}:\n            return False\n")
+        elif schema_type == "map":
+            out.write("    if not isinstance(v, dict) or '$uses' in v:\n        return False\n")
+            values = node.get("values")
+            if values:
+                out.write(f"    for x in v.values():\n        if not {self.expression(values, 'x')}:\n            return False\n")
+        else:
+            self.emit_object(node)
+        out.write("    return True\n\n")
+
+    def emit_object(self, node):
+        out = self.out
+        props = node.get("properties", {})
+        if not isinstance(props, Mapping) or ("properties" in node and not props):
+            raise _Unsupported(props)
+        required = node.get("required", [])
+        if not isinstance(required, list) or not all(isinstance(r, str) for r in required):
+            raise _Unsupported(required)
+        out.write("    if not isinstance(v, dict) or '$uses' in v:\n        return False\n")
+        for r in required:
+            out.write(f"    if {r!r} not in v:\n        return False\n")
+        for prop, prop_schema in props.items():
+            if not isinstance(prop, str):
+                raise _Unsupported(prop)
+            check = f"not {self.expression(prop_schema, f'v[{prop!r}]')}"
+            if prop not in required:
+                check = f"{prop!r} in v and {check}"
+            out.write(f"    if {check}:\n        return False\n")
+        addl = node.get("additionalProperties", True)
+        if addl is False:
+            names = self.constant(frozenset(props))
+            out.write(f"    if not {names}.issuperset(v):\n        return False\n")
+        elif isinstance(addl, Mapping):
+            names = self.constant(frozenset(props))
+            out.write(f"    for k, x in v.items():\n        if k not in {names} and not {self.expression(addl, 'x')}:\n            return False\n")
+        elif addl is not True:
+            raise _Unsupported(addl)
+
+
+def compile_schema(schema):
+    """
+    Compiles a JSON Structure Core schema into a validity predicate.
+    Results are cached by the schema's content, so validators built repeatedly for
+    the same schema share one compiled function.
+    :param schema: The root schema.
+    :return: A function taking an instance and returning True if it is valid and
+             False if it may not be, or None if the schema is outside the compiled subset.
+    """
+    if not isinstance(schema, Mapping) or schema.get("$schema") != CORE_METASCHEMA or "$uses" in schema:
+        return None
+    try:
+        key = repr(schema)
+    except RecursionError:
+        return None
+    if key in _COMPILED:
+        return _COMPILED[key]
+    generator = _Generator(schema)
+    try:
+        entry = generator.generate()
+    except _Unsupported:
+        check = None
+    else:
+        namespace = generator.namespace
+        exec(compile(generator.out.getvalue(), "<json-structure schema>", "exec"), namespace)
+        check = namespace[entry]
+    if len(_COMPILED) >= _COMPILED_SIZE:
+        del _COMPILED[next(iter(_COMPILED))]
+    _COMPILED[key] = check
+    return check
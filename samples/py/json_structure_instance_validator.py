@@ -25,13 +25,16 @@ Usage:
 The code sections are annotated with references to the metaschema constructs.
 """
 
-import sys
+import functools
 import json
 import re
-import datetime
 import uuid
+from collections.abc import Mapping
 from urllib.parse import urlparse
 
+from json_structure_codegen import compile_schema
+from json_structure_loader import load_import_file, parse_json
+
 # Regular expressions for date, datetime, time and JSON pointer.
 _DATE_REGEX = re.compile(r'^\d{4}-\d{2}-\d{2}$')
 _DATETIME_REGEX = re.compile(
@@ -40,6 +43,346 @@ _DATETIME_REGEX = re.compile(
 _TIME_REGEX = re.compile(r'^\d{2}:\d{2}:\d{2}(?:\.\d+)?$')
 _JSONPOINTER_REGEX = re.compile(r'^#(\/[^\/]+)*$')
 
+# Inclusive (min, max) of the integer types carried as JSON numbers...
+_INT_RANGES = {
+    "int8": (-2**7, 2**7 - 1),
+    "uint8": (0, 2**8 - 1),
+    "int16": (-2**15, 2**15 - 1),
+    "uint16": (0, 2**16 - 1),
+    "int32": (-2**31, 2**31 - 1),
+    "integer": (-2**31, 2**31 - 1),
+    "uint32": (0, 2**32 - 1),
+}
+
+# ...and of those carried as strings, since they exceed the precision of a double.
+_STRING_INT_RANGES = {
+    "int64": (-2**63, 2**63 - 1),
+    "uint64": (0, 2**64 - 1),
+    "int128": (-2**127, 2**127 - 1),
+    "uint128": (0, 2**128 - 1),
+}
+
+# Addins enabled automatically for schemas with $uses under the extended metaschema.
+_ALL_ADDINS = (
+    "JSONStructureConditionalComposition",
+    "JSONStructureValidation",
+    "JSONStructureUnits",
+    "JSONStructureAlternateNames"
+)
+
+# Regular expressions for the string formats of the JSONStructureValidation addin.
+_EMAIL_REGEX = re.compile(r'^[^@]+@[^@]+\.[^@]+$')
+_IPV6_REGEX = re.compile(r'^[0-9a-fA-F:]+$')
+_HOSTNAME_REGEX = re.compile(r'^[a-zA-Z0-9.-]+$')
+# A scheme followed by printable ASCII without brackets: urlparse() would find the
+# scheme and cannot raise for such a string, so it need not be called.
+_URI_SCHEME_REGEX = re.compile(r'[A-Za-z][A-Za-z0-9+.\-]*:[\x21-\x5a\x5c\x5e-\x7e]*\Z')
+
+
+def _has_uri_scheme(value):
+    """
+    :return: True if urlparse() finds a scheme in the string, checked with a single
+             anchored regex match before falling back to urlparse().
+    """
+    return _URI_SCHEME_REGEX.match(value) is not None or bool(urlparse(value).scheme)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_pattern(pattern):
+    """
+    Compiles a schema-supplied regular expression once and reuses it across validations.
+    :param pattern: The pattern string from "pattern", "patternProperties" or "patternKeys".
+    :return: The compiled pattern.
+    :raises re.error: If the pattern is not a valid regular expression.
+    :raises TypeError: If the pattern is not a string.
+    """
+    return re.compile(pattern)
+
+
+# JSON scalar types, which can be looked up in a set.
+_HASHABLE_TYPES = (str, int, float, bool, type(None))
+
+
+# Item types whose == agrees with equality of their canonical JSON form (floats are
+# excluded because 0.0 == -0.0 and NaN != NaN).
+_SET_COMPARABLE_TYPES = frozenset((str, int, bool, type(None)))
+
+# Compact, key-sorted encoder for comparing JSON values by their canonical text.
+# Built once: json.dumps with keyword arguments constructs a new encoder per call.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def _has_duplicates(items):
+    """
+    Reports whether a JSON array contains two equal items, comparing items by their
+    canonical JSON form. Arrays made only of strings, integers, booleans and nulls are
+    checked with a set directly; anything else is compared via _CANONICAL_ENCODER.
+    :param items: The array instance.
+    :return: True if the array contains duplicates.
+    """
+    item_types = set(map(type, items))
+    if item_types <= _SET_COMPARABLE_TYPES:
+        if len(item_types) <= 1:
+            return len(set(items)) != len(items)
+        # Mixed scalar types: keep 1, True and "1" apart as their JSON forms are.
+        return len({(type(x), x) for x in items}) != len(items)
+    serialized = list(map(_CANONICAL_ENCODER.encode, items))
+    return len(serialized) != len(set(serialized))
+
+
+def _compile_pattern_entries(pattern_map):
+    """
+    Compiles the keys of a patternProperties/patternKeys mapping.
+    :param pattern_map: Mapping of regular expression strings to subschemas.
+    :return: Tuple of (pattern_str, compiled pattern or None if invalid, subschema).
+    """
+    entries = []
+    for pattern_str, pattern_schema in pattern_map.items():
+        try:
+            pattern = _compile_pattern(pattern_str)
+        except re.error:
+            pattern = None
+        entries.append((pattern_str, pattern, pattern_schema))
+    return tuple(entries)
+
+
+# Types whose minimum/maximum/multipleOf constraints are checked by the validation addin.
+_ADDIN_NUMERIC_TYPES = (
+    "number", "integer", "float", "double", "decimal",
+    "int8", "uint8", "int16", "uint16", "int32", "uint32",
+    "int64", "uint64", "int128", "uint128", "float8"
+)
+
+
+def _is_number(value):
+    return type(value) in (int, float)
+
+
+def _numeric_check(schema):
+    """
+    Builds a predicate for the numeric validation keywords of a schema.
+    The predicate returns True only if the value satisfies every constraint; False
+    means the caller must run the keyword-by-keyword checks to find out which failed.
+    :param schema: A schema with a numeric type.
+    :return: The predicate, or None if a constraint is not a plain number.
+    """
+    lo = schema.get("minimum", float("-inf"))
+    hi = schema.get("maximum", float("inf"))
+    step = schema.get("multipleOf")
+    if not _is_number(lo) or not _is_number(hi) or not (step is None or _is_number(step) and step != 0):
+        return None
+    lo_exclusive = schema.get("exclusiveMinimum") is True
+    hi_exclusive = schema.get("exclusiveMaximum") is True
+
+    def check(value):
+        if not _is_number(value):
+            return False
+        if value < lo or value > hi or (lo_exclusive and value <= lo) or (hi_exclusive and value >= hi):
+            return False
+        if step is None:
+            return True
+        try:
+            quotient = value / step
+            return abs(quotient - round(quotient)) <= 1e-10
+        except (OverflowError, ValueError):
+            return False
+    return check
+
+
+def _string_check(schema):
+    """
+    Builds a predicate for the minLength/maxLength/pattern keywords of a string schema,
+    with the same contract as _numeric_check.
+    :param schema: A schema of type string.
+    :return: The predicate, or None if format is present or a constraint is malformed.
+    """
+    if "format" in schema:
+        return None
+    min_length = schema.get("minLength", 0)
+    max_length = schema.get("maxLength")
+    if type(min_length) is not int or not (max_length is None or type(max_length) is int):
+        return None
+    pattern = None
+    if "pattern" in schema:
+        try:
+            pattern = _compile_pattern(schema["pattern"])
+        except (re.error, TypeError):
+            return None
+
+    def check(value):
+        if type(value) is not str:
+            return False
+        length = len(value)
+        if length < min_length or (max_length is not None and length > max_length):
+            return False
+        return pattern is None or pattern.search(value) is not None
+    return check
+
+
+class _SchemaPlan:
+    """
+    Instance-independent data precomputed from one schema node, so that validating
+    many instances does not rebuild it. Plans are built once per validator for every
+    node of the root schema; a field is None when the keyword is absent or the
+    precomputation does not apply, in which case the validator reads the schema directly.
+    """
+    __slots__ = ("enum_set", "required", "required_set", "dependent_required",
+                 "pattern_properties", "pattern_keys", "value_check", "all_of_merged")
+
+    def __init__(self, schema):
+        self.enum_set = None
+        enum = schema.get("enum")
+        if isinstance(enum, list):
+            try:
+                self.enum_set = frozenset(enum)
+            except TypeError:
+                pass
+        # required keeps the declared order for error messages; required_set finds
+        # the missing names with one set difference against the instance.
+        self.required = None
+        self.required_set = None
+        required = schema.get("required")
+        if isinstance(required, list):
+            try:
+                self.required_set = frozenset(required)
+                self.required = tuple(required)
+            except TypeError:
+                pass
+        self.dependent_required = self._dependent_required_table(schema.get("dependentRequired"))
+        self.pattern_properties = self._pattern_entries(schema.get("patternProperties"))
+        self.pattern_keys = self._pattern_entries(schema.get("patternKeys"))
+        # Single predicate over the validation addin keywords of a numeric or string
+        # schema; when it passes, the keyword-by-keyword checks are skipped.
+        self.value_check = None
+        schema_type = schema.get("type")
+        if schema_type in _ADDIN_NUMERIC_TYPES:
+            self.value_check = _numeric_check(schema)
+        elif schema_type == "string":
+            self.value_check = _string_check(schema)
+        # Single object schema equivalent to an allOf of plain object schemas; set by
+        # the validator, which knows the root $uses the subschemas are validated with.
+        self.all_of_merged = None
+
+    @staticmethod
+    def _dependent_required_table(dependent_required):
+        """
+        :return: Tuple of (trigger, dependencies tuple, dependencies frozenset) for each
+                 trigger with a list of dependencies, or None if the keyword is absent or
+                 a dependency cannot be hashed.
+        """
+        if not isinstance(dependent_required, Mapping):
+            return None
+        try:
+            return tuple((trigger, tuple(deps), frozenset(deps))
+                         for trigger, deps in dependent_required.items() if isinstance(deps, list))
+        except TypeError:
+            return None
+
+    @staticmethod
+    def _pattern_entries(pattern_map):
+        if not isinstance(pattern_map, Mapping):
+            return None
+        try:
+            return _compile_pattern_entries(pattern_map)
+        except TypeError:
+            return None
+
+
+# Keywords an allOf subschema may carry and still be merged into one object schema.
+_MERGEABLE_KEYWORDS = frozenset(("type", "properties", "required", "name", "description"))
+
+
+def _merge_object_schemas(subschemas):
+    """
+    Merges allOf subschemas that are all plain object schemas (type, properties and
+    required only) into a single object schema with the union of their properties
+    and required names.
+    :param subschemas: The flattened allOf subschemas.
+    :return: The merged schema, or None if a subschema is not a plain object schema or
+             two subschemas declare the same property with different schemas.
+    """
+    if len(subschemas) < 2:
+        return None
+    properties = {}
+    required = []
+    for subschema in subschemas:
+        if (not isinstance(subschema, Mapping) or not _MERGEABLE_KEYWORDS.issuperset(subschema)
+                or subschema.get("type") != "object"):
+            return None
+        props = subschema.get("properties")
+        sub_required = subschema.get("required", [])
+        if not isinstance(props, Mapping) or not props or not isinstance(sub_required, list):
+            return None
+        for key, prop_schema in props.items():
+            if properties.setdefault(key, prop_schema) is not prop_schema:
+                return None
+        for name in sub_required:
+            if not isinstance(name, str):
+                return None
+            if name not in required:
+                required.append(name)
+    return {"type": "object", "properties": properties, "required": required}
+
+
+def _thaw(obj):
+    """
+    Returns a copy of a schema made of plain dicts and lists, for the steps that
+    rewrite the schema (imports). Read-only mappings are copied like dicts.
+    """
+    if isinstance(obj, Mapping):
+        return {key: _thaw(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_thaw(item) for item in obj]
+    return obj
+
+
+def _flatten_composition(subschemas, keyword):
+    """
+    Flattens an allOf/anyOf subschema list.
+    A subschema that consists of nothing but the same keyword (e.g. {"allOf": [A, B]}
+    inside an allOf) is replaced by its own subschemas, so allOf:[allOf:[A, B], C]
+    becomes [A, B, C] and allOf:[allOf:[X]] becomes [X].
+    :param subschemas: The list of subschemas of the composition keyword.
+    :param keyword: "allOf" or "anyOf".
+    :return: The flattened list of subschemas.
+    """
+    flattened = []
+    for subschema in subschemas:
+        if isinstance(subschema, Mapping) and len(subschema) == 1 and isinstance(subschema.get(keyword), list):
+            flattened.extend(_flatten_composition(subschema[keyword], keyword))
+        else:
+            flattened.append(subschema)
+    return flattened
+
+
+class _FailFast(BaseException):
+    """
+    Raised by the first error recorded while probing whether an instance matches a
+    schema, or by the first error reported in fail_fast mode.
+    Derived from BaseException, like GeneratorExit, so that the "except Exception"
+    handlers guarding individual keyword checks never swallow it.
+    """
+
+
+class ValidationError(str):
+    """
+    A validation error message that also carries a machine-readable error code,
+    the JSON Pointer of the offending instance location and, for some codes, the
+    values the message was built from (e.g. the missing property name), so callers
+    can inspect an error without parsing its text.
+    Being a str, it compares, prints and formats exactly like the plain message.
+    """
+
+    def __new__(cls, code, path, message, params=()):
+        error = super().__new__(cls, message)
+        error.code = code
+        error.path = path
+        error.params = params
+        return error
+
+    def __getnewargs__(self):
+        return (self.code, self.path, str(self), self.params)
+
 
 class JSONStructureInstanceValidator:
     """
@@ -50,7 +393,11 @@ class JSONStructureInstanceValidator:
     """
     ABSOLUTE_URI_REGEX = re.compile(r'^[a-zA-Z][a-zA-Z0-9+\-.]*://')
 
-    def __init__(self, root_schema, allow_import=False, import_map=None, extended=False, external_schemas=None):
+    class ResolutionError(Exception):
+        """Raised at construction time for an unresolvable $ref or $extends when strict_refs is enabled."""
+
+    def __init__(self, root_schema, allow_import=False, import_map=None, extended=False, external_schemas=None,
+                 strict_refs=False, fail_fast=False):
         """
         Initializes the validator.
         :param root_schema: The JSON Structure (as dict).
@@ -59,23 +406,178 @@ class JSONStructureInstanceValidator:
         :param extended: Enable extended validation features.
         :param external_schemas: List of schema dicts to use for resolving imports by $id.
                                  Each schema should have a '$id' field matching the import URI.
+        :param strict_refs: Resolve every $ref and $extends up front and raise ResolutionError
+                            for the first one that cannot be resolved, instead of reporting it
+                            as a validation error each time it is reached.
+        :param fail_fast: Stop at the first error, for callers that only need to know whether
+                          an instance is valid.
         """
         self.root_schema = root_schema
         self.errors = []
+        # Enabled once the schema is loaded, so that every loading error is recorded.
+        self.fail_fast = False
+        # True while _matches() is probing a subschema and only needs a yes/no answer.
+        self._probing = False
         self.allow_import = allow_import
         self.import_map = import_map if import_map is not None else {}
         self.extended = extended
         self.enabled_extensions = set()
+        # Memoized JSON pointer resolutions, keyed by the $ref string.
+        self._ref_cache = {}
         # Build lookup for external schemas by $id
         self.external_schemas = {}
         if external_schemas:
             for schema in external_schemas:
-                if isinstance(schema, dict) and "$id" in schema:
+                if isinstance(schema, Mapping) and "$id" in schema:
                     self.external_schemas[schema["$id"]] = schema
         # Process $import and $importdefs if enabled. [Metaschema: JSONStructureImport extension constructs]
         if self.allow_import:
+            # Imports are merged into a private copy; the caller's schema is never modified.
+            self.root_schema = _thaw(self.root_schema)
             self._process_imports(self.root_schema, "#")
+        # The extended metaschema enables every addin for a schema with $uses. The
+        # root's list is extended on a copy once here; nested nodes are handled in
+        # validate_instance.
+        if self.root_schema.get("$schema") == "https://json-structure.org/meta/extended/v0/#":
+            self.root_schema = self._with_all_addins(self.root_schema)
+        if strict_refs:
+            self._check_refs(self.root_schema, "#")
+        # Precomputed _SchemaPlan per schema node, keyed by id() and holding the node
+        # itself so that a recycled id can never match a different dict. The same walk
+        # resolves every local $ref/$extends pointer into _ref_cache.
+        self._plans = {}
+        self._build_plans(self.root_schema)
         self._detect_enabled_extensions()
+        # Generated validity predicate for the root schema (see json_structure_codegen),
+        # or None when the schema or the enabled add-ins are outside the compiled subset.
+        # extended alone does not prevent compiling: without enabled add-ins it changes
+        # nothing for the keywords the predicate covers.
+        self._compiled = None
+        if not self.enabled_extensions:
+            self._compiled = compile_schema(self.root_schema)
+        # Errors recorded while loading the schema (e.g. unresolved imports); every
+        # validate_instance() call reports them ahead of the instance's own errors.
+        self._schema_errors = tuple(self.errors)
+        self.fail_fast = fail_fast
+
+    def _error(self, code, path, message, params=None):
+        """
+        Records a validation error.
+        :param code: Machine-readable error code, e.g. "EXPECTED_STRING".
+        :param path: JSON Pointer of the instance location, or None if not applicable.
+        :param message: Human-readable error message. If params is given, a str.format
+                        template filled with params (and {path}) only once the error is
+                        recorded, so that probing never builds the text.
+        :param params: Optional tuple of values exposed as ValidationError.params.
+        """
+        if self._probing:
+            raise _FailFast()
+        if params is None:
+            self.errors.append(ValidationError(code, path, message))
+        else:
+            self.errors.append(ValidationError(code, path, message.format(*params, path=path), params))
+        if self.fail_fast:
+            raise _FailFast()
+
+    def _matches(self, instance, schema, path):
+        """
+        Checks whether an instance is valid against a subschema without building error messages.
+        Validation stops at the first error; self.errors is left untouched.
+        :return: True if the instance validates against the schema.
+        """
+        saved_errors, saved_probing = self.errors, self._probing
+        self.errors, self._probing = [], True
+        try:
+            self.validate_instance(instance, schema, path)
+            return not self.errors
+        except _FailFast:
+            return False
+        finally:
+            self.errors, self._probing = saved_errors, saved_probing
+
+    def _collect_errors(self, instance, schema, path):
+        """
+        Validates an instance against a subschema and returns its errors separately,
+        leaving self.errors untouched. Used to describe composition failures.
+        """
+        saved_errors, saved_fail_fast = self.errors, self.fail_fast
+        self.errors, self.fail_fast = [], False
+        try:
+            self.validate_instance(instance, schema, path)
+            return self.errors
+        finally:
+            self.errors, self.fail_fast = saved_errors, saved_fail_fast
+
+    def _with_root_uses(self, subschema):
+        """
+        Returns a copy of a composition subschema whose $uses also lists the root schema's addins,
+        so the subschema is validated in the same addin context. The subschema itself is not modified.
+        """
+        root_uses = self.root_schema.get("$uses")
+        if not root_uses:
+            return dict(subschema)
+        enhanced = dict(subschema)
+        if "$uses" not in enhanced:
+            enhanced["$uses"] = list(root_uses)
+        else:
+            uses = list(enhanced["$uses"])
+            for addin in root_uses:
+                if addin not in uses:
+                    uses.append(addin)
+            enhanced["$uses"] = uses
+        return enhanced
+
+    @staticmethod
+    def _with_all_addins(schema):
+        """
+        Returns the schema itself if it has no $uses or its $uses already lists every
+        addin, otherwise a shallow copy whose $uses list has the missing addins appended.
+        """
+        schema_uses = schema.get("$uses")
+        if schema_uses is None:
+            return schema
+        missing = [addin for addin in _ALL_ADDINS if addin not in schema_uses]
+        if not missing:
+            return schema
+        enhanced = dict(schema)
+        enhanced["$uses"] = list(schema_uses) + missing
+        return enhanced
+
+    def _build_plans(self, obj):
+        """
+        Recursively builds a _SchemaPlan for every mapping in the schema and resolves
+        its $ref and $extends pointers ahead of validation.
+        Literal instance values (const, enum, default, examples) are not descended into.
+        :param obj: The schema object to plan.
+        """
+        if isinstance(obj, Mapping):
+            if id(obj) in self._plans:
+                return
+            plan = _SchemaPlan(obj)
+            self._plans[id(obj)] = (obj, plan)
+            for key, value in obj.items():
+                if key in ("$ref", "$extends") and isinstance(value, str):
+                    self._resolve_ref(value)
+                elif key not in ("const", "enum", "default", "examples"):
+                    self._build_plans(value)
+            if isinstance(obj.get("allOf"), list):
+                merged = _merge_object_schemas(_flatten_composition(obj["allOf"], "allOf"))
+                if merged is not None:
+                    plan.all_of_merged = self._with_root_uses(merged)
+                    self._build_plans(plan.all_of_merged)
+        elif isinstance(obj, list):
+            for item in obj:
+                self._build_plans(item)
+
+    def _plan_for(self, schema):
+        """
+        Returns the precomputed plan for a node of the root schema, or None for
+        schemas synthesized during validation (merged $extends, unions, add-ins).
+        """
+        entry = self._plans.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            return entry[1]
+        return None
 
     def _detect_enabled_extensions(self):
         schema_uri = self.root_schema.get("$schema", "")
@@ -96,41 +598,50 @@ class JSONStructureInstanceValidator:
         :param instance: The JSON instance.
         :param schema: The schema to validate against (defaults to root schema).
         :param path: JSON Pointer for error reporting.
-        :return: List of error messages.
+        :return: List of error messages (ValidationError strings carrying .code and .path).
+                 Each call without a schema starts a new list, so one validator can be
+                 reused for many instances. In fail_fast mode, at most one message.
         """
         if schema is None:
             schema = self.root_schema
+            self.errors = list(self._schema_errors)
+            if self._compiled is not None and self._compiled(instance):
+                return self.errors
+            if self.fail_fast:
+                if self.errors:
+                    del self.errors[1:]
+                    return self.errors
+                try:
+                    self.validate_instance(instance, schema, path, meta)
+                except _FailFast:
+                    pass
+                return self.errors
+        # Looked up once per call; both are consulted several times below.
+        root_meta = self.root_schema.get("$schema")
+        instance_uses = instance.get("$uses") if isinstance(instance, dict) else None
 
         # --- Automatically enable all addins if using extended metaschema ---
         # Only do this if $uses is present; otherwise, do NOT auto-enable addins (per spec)
-        if self.root_schema.get("$schema") == "https://json-structure.org/meta/extended/v0/#":
-            if "$uses" in schema:
-                all_addins = [
-                    "JSONStructureConditionalComposition",
-                    "JSONStructureValidation",
-                    "JSONStructureUnits",
-                    "JSONStructureAlternateNames"
-                ]
-                schema.setdefault("$uses", [])
-                for addin in all_addins:
-                    if addin not in schema["$uses"]:
-                        schema["$uses"].append(addin)
+        # Addins enabled below are added to a copy of the schema, never to the caller's.
+        if root_meta == "https://json-structure.org/meta/extended/v0/#":
+            schema = self._with_all_addins(schema)
             # If $uses is not present, do not auto-enable addins; enforcement is handled later
 
-        if isinstance(instance, dict) and "$uses" in instance and self.root_schema.get("$schema") == "https://json-structure.org/meta/validation/v0/#":
+        if instance_uses is not None and root_meta == "https://json-structure.org/meta/validation/v0/#":
             # Automatically enable the JSONStructureValidation addin.
-            schema.setdefault("$uses", [])
-            if "JSONStructureValidation" in instance["$uses"] and not "JSONStructureValidation" in schema["$uses"]:
-                schema["$uses"].append("JSONStructureValidation")
-            if "JSONStructureConditionalComposition" in instance["$uses"] and not "JSONStructureConditionalComposition" in schema["$uses"]:
-                schema["$uses"].append("JSONStructureConditionalComposition")
+            schema_uses = schema.get("$uses", [])
+            added = [addin for addin in ("JSONStructureValidation", "JSONStructureConditionalComposition")
+                     if addin in instance_uses and addin not in schema_uses]
+            if added or "$uses" not in schema:
+                schema = dict(schema)
+                schema["$uses"] = list(schema_uses) + added
             # [Metaschema: JSONStructureValidation metaschema automatically enables JSONStructureValidation addin]
 
         # the core schema https://json-structure.org/meta/validation/v0/# has no JSONStructureConditionalComposition or JSONStructureValidation addins
         # an instance referencing these addins will be rejected
-        if isinstance(instance, dict) and "$uses" in instance and self.root_schema.get("$schema") == "https://json-structure.org/meta/core/v0/#":
-            if "JSONStructureValidation" in instance["$uses"] or "JSONStructureConditionalComposition" in instance["$uses"]:
-                self.errors.append(
+        if instance_uses is not None and root_meta == "https://json-structure.org/meta/core/v0/#":
+            if "JSONStructureValidation" in instance_uses or "JSONStructureConditionalComposition" in instance_uses:
+                self._error("ADDIN_NOT_SUPPORTED", path,
                     f"Instance at {path} references JSONStructureConditionalComposition or JSONStructureValidation addins but the schema does not support them")
 
         # Resolve $ref at schema level. [Metaschema: TypeReference]
@@ -138,53 +649,51 @@ class JSONStructureInstanceValidator:
             ref = schema["$ref"]
             resolved = self._resolve_ref(ref)
             if resolved is None:
-                self.errors.append(f"Cannot resolve $ref {ref} at {path}")
+                self._error("UNRESOLVED_REF", path, f"Cannot resolve $ref {ref} at {path}")
                 return self.errors
             return self.validate_instance(instance, resolved, path)
         
+        root_uses = self.root_schema.get("$uses") or ()
         hasConditionals = False
-        if "$uses" in self.root_schema:
-            if "JSONStructureConditionalComposition" in self.root_schema["$uses"]:
-                hasConditionals = self._validate_conditionals(schema, instance, path)        # Handle schemas that are only conditional composition at the root (no 'type')
+        if "JSONStructureConditionalComposition" in root_uses:
+            hasConditionals = self._validate_conditionals(schema, instance, path)        # Handle schemas that are only conditional composition at the root (no 'type')
         conditional_keywords = ("allOf", "anyOf", "oneOf", "not", "if", "then", "else")
         has_conditionals_at_root = any(k in schema for k in conditional_keywords)
         if not schema.get("type") and has_conditionals_at_root:
-            schema_uri = self.root_schema.get("$schema", "")
+            schema_uri = root_meta or ""
             is_validation = schema_uri.endswith("/validation/v0/#")
             is_extended = schema_uri.endswith("/extended/v0/#")
             
             # Check extended metaschema enforcement first
-            if is_extended and not (isinstance(self.root_schema, dict) and "$uses" in self.root_schema and "JSONStructureConditionalComposition" in self.root_schema["$uses"]):
-                self.errors.append(
+            if is_extended and "JSONStructureConditionalComposition" not in root_uses:
+                self._error("CONDITIONALS_NOT_ENABLED", path,
                     "Conditional composition is not enabled: $uses must include 'JSONStructureConditionalComposition' for the extended metaschema")
                 return self.errors
             
             enable_conditional = (
                 self.extended or
                 is_validation or
-                (isinstance(self.root_schema, dict) and "$uses" in self.root_schema and (
-                    "JSONStructureConditionalComposition" in self.root_schema["$uses"] or "JSONStructureValidation" in self.root_schema["$uses"]
-                ))
+                "JSONStructureConditionalComposition" in root_uses or "JSONStructureValidation" in root_uses
             )
             
             if enable_conditional:
                 self._validate_conditionals(schema, instance, path)
                 return self.errors
             else:
-                self.errors.append(f"Conditional composition keywords present at {path} but not enabled")
+                self._error("CONDITIONALS_NOT_ENABLED", path, f"Conditional composition keywords present at {path} but not enabled")
                 return self.errors
 
         # Handle case where "type" is a dict with a $ref. [Metaschema: PrimitiveOrReference]
         schema_type = schema.get("type")
         if not schema_type:
-            self.errors.append(f"Schema at {path} has no 'type'")
+            self._error("MISSING_TYPE", path, f"Schema at {path} has no 'type'")
             return self.errors
             
-        if isinstance(schema_type, dict):
+        if isinstance(schema_type, Mapping):
             if "$ref" in schema_type:
                 resolved = self._resolve_ref(schema_type["$ref"])
                 if resolved is None:
-                    self.errors.append(f"Cannot resolve $ref {schema_type['$ref']} at {path}/type")
+                    self._error("UNRESOLVED_REF", f"{path}/type", f"Cannot resolve $ref {schema_type['$ref']} at {path}/type")
                     return self.errors
                 new_schema = dict(schema)
                 new_schema["type"] = resolved.get("type")
@@ -195,40 +704,33 @@ class JSONStructureInstanceValidator:
                 schema = new_schema
                 schema_type = schema.get("type")
             else:
-                self.errors.append(f"Schema at {path} has invalid 'type'")
+                self._error("INVALID_TYPE", path, f"Schema at {path} has invalid 'type'")
                 return self.errors
 
         # Handle union types. [Metaschema: TypeUnion]
         if isinstance(schema_type, list):
-            union_valid = False
-            union_errors = []
-            for t in schema_type:
-                backup = list(self.errors)
-                self.errors = []
-                self.validate_instance(instance, {"type": t}, path)
-                if not self.errors:
-                    union_valid = True
-                    break
-                else:
-                    union_errors.extend(self.errors)
-                self.errors = backup
-            if not union_valid:
-                self.errors.append(f"Instance at {path} does not match any type in union: {union_errors}")
+            if not any(self._matches(instance, {"type": t}, path) for t in schema_type):
+                if self._probing:
+                    raise _FailFast()
+                union_errors = []
+                for t in schema_type:
+                    union_errors.extend(self._collect_errors(instance, {"type": t}, path))
+                self._error("UNION_MISMATCH", path, f"Instance at {path} does not match any type in union: {union_errors}")
             return self.errors
 
         if not isinstance(schema_type, str):
-            self.errors.append(f"Schema at {path} has invalid 'type'")
+            self._error("INVALID_TYPE", path, f"Schema at {path} has invalid 'type'")
             return self.errors        # Process $extends. [Metaschema: $extends in ObjectType/TupleType]
         if schema_type != "choice" and "$extends" in schema:
             base = self._resolve_ref(schema["$extends"])
             if base is None:
-                self.errors.append(f"Cannot resolve $extends {schema['$extends']} at {path}")
+                self._error("UNRESOLVED_EXTENDS", path, f"Cannot resolve $extends {schema['$extends']} at {path}")
                 return self.errors
             base_props = base.get("properties", {})
             derived_props = schema.get("properties", {})
             for key in base_props:
                 if key in derived_props:
-                    self.errors.append(
+                    self._error("PROPERTY_REDEFINED", path,
                         f"Property '{key}' is inherited via $extends and must not be redefined at {path}")
             merged = dict(base)
             merged.update(schema)
@@ -243,7 +745,7 @@ class JSONStructureInstanceValidator:
 
         # Reject abstract schemas. [Metaschema: abstract property]
         if schema.get("abstract") is True:
-            self.errors.append(f"Abstract schema at {path} cannot be used for instance validation")
+            self._error("ABSTRACT_SCHEMA", path, f"Abstract schema at {path} cannot be used for instance validation")
             return self.errors
 
         # Process $uses add-in. [Metaschema: $offers and $uses]
@@ -257,151 +759,105 @@ class JSONStructureInstanceValidator:
             pass
         elif schema_type == "string":
             if not isinstance(instance, str):
-                self.errors.append(f"Expected string at {path}, got {type(instance).__name__}")
+                self._error("EXPECTED_STRING", path, f"Expected string at {path}, got {type(instance).__name__}")
         elif schema_type == "number":
             if isinstance(instance, bool) or not isinstance(instance, (int, float)):
-                self.errors.append(f"Expected number at {path}, got {type(instance).__name__}")
+                self._error("EXPECTED_NUMBER", path, f"Expected number at {path}, got {type(instance).__name__}")
         elif schema_type == "boolean":
             if not isinstance(instance, bool):
-                self.errors.append(f"Expected boolean at {path}, got {type(instance).__name__}")
+                self._error("EXPECTED_BOOLEAN", path, f"Expected boolean at {path}, got {type(instance).__name__}")
         elif schema_type == "null":
             if instance is not None:
-                self.errors.append(f"Expected null at {path}, got {type(instance).__name__}")
-        elif schema_type == "int8":
-            if not isinstance(instance, int):
-                self.errors.append(f"Expected int8 at {path}, got {type(instance).__name__}")
-            elif not (-2**7 <= instance <= 2**7 - 1):
-                self.errors.append(f"int8 value at {path} out of range")
-        elif schema_type == "uint8":
-            if not isinstance(instance, int):
-                self.errors.append(f"Expected uint8 at {path}, got {type(instance).__name__}")
-            elif not (0 <= instance <= 2**8 - 1):
-                self.errors.append(f"uint8 value at {path} out of range")
-        elif schema_type == "int16":
-            if not isinstance(instance, int):
-                self.errors.append(f"Expected int16 at {path}, got {type(instance).__name__}")
-            elif not (-2**15 <= instance <= 2**15 - 1):
-                self.errors.append(f"int16 value at {path} out of range")
-        elif schema_type == "uint16":
-            if not isinstance(instance, int):
-                self.errors.append(f"Expected uint16 at {path}, got {type(instance).__name__}")
-            elif not (0 <= instance <= 2**16 - 1):
-                self.errors.append(f"uint16 value at {path} out of range")
-        elif schema_type == "int32" or schema_type == "integer":
+                self._error("EXPECTED_NULL", path, f"Expected null at {path}, got {type(instance).__name__}")
+        elif schema_type in _INT_RANGES:
+            low, high = _INT_RANGES[schema_type]
             if not isinstance(instance, int):
-                self.errors.append(f"Expected {schema_type} at {path}, got {type(instance).__name__}")
-            elif not (-2**31 <= instance <= 2**31 - 1):
-                self.errors.append(f"{schema_type} value at {path} out of range")
-        elif schema_type == "uint32":
-            if not isinstance(instance, int):
-                self.errors.append(f"Expected uint32 at {path}, got {type(instance).__name__}")
-            elif not (0 <= instance <= 2**32 - 1):
-                self.errors.append(f"uint32 value at {path} out of range")
-        elif schema_type == "int64":
-            if not isinstance(instance, str):
-                self.errors.append(f"Expected int64 as string at {path}, got {type(instance).__name__}")
-            else:
-                try:
-                    value = int(instance)
-                    if not (-2**63 <= value <= 2**63 - 1):
-                        self.errors.append(f"int64 value at {path} out of range")
-                except ValueError:
-                    self.errors.append(f"Invalid int64 format at {path}")
-        elif schema_type == "uint64":
+                self._error(f"EXPECTED_{schema_type.upper()}", path, f"Expected {schema_type} at {path}, got {type(instance).__name__}")
+            elif not (low <= instance <= high):
+                self._error("OUT_OF_RANGE", path, f"{schema_type} value at {path} out of range")
+        elif schema_type in _STRING_INT_RANGES:
             if not isinstance(instance, str):
-                self.errors.append(f"Expected uint64 as string at {path}, got {type(instance).__name__}")
+                self._error(f"EXPECTED_{schema_type.upper()}", path, f"Expected {schema_type} as string at {path}, got {type(instance).__name__}")
             else:
+                low, high = _STRING_INT_RANGES[schema_type]
                 try:
                     value = int(instance)
-                    if not (0 <= value <= 2**64 - 1):
-                        self.errors.append(f"uint64 value at {path} out of range")
                 except ValueError:
-                    self.errors.append(f"Invalid uint64 format at {path}")
-        elif schema_type == "int128":
-            if not isinstance(instance, str):
-                self.errors.append(f"Expected int128 as string at {path}, got {type(instance).__name__}")
-            else:
-                try:
-                    value = int(instance)
-                    if not (-2**127 <= value <= 2**127 - 1):
-                        self.errors.append(f"int128 value at {path} out of range")
-                except ValueError:
-                    self.errors.append(f"Invalid int128 format at {path}")
-        elif schema_type == "uint128":
-            if not isinstance(instance, str):
-                self.errors.append(f"Expected uint128 as string at {path}, got {type(instance).__name__}")
-            else:
-                try:
-                    value = int(instance)
-                    if not (0 <= value <= 2**128 - 1):
-                        self.errors.append(f"uint128 value at {path} out of range")
-                except ValueError:
-                    self.errors.append(f"Invalid uint128 format at {path}")
+                    self._error("INVALID_FORMAT", path, f"Invalid {schema_type} format at {path}")
+                else:
+                    if not (low <= value <= high):
+                        self._error("OUT_OF_RANGE", path, f"{schema_type} value at {path} out of range")
         elif schema_type == "float8":
             if not isinstance(instance, (int, float)):
-                self.errors.append(f"Expected float8 at {path}, got {type(instance).__name__}")
+                self._error("EXPECTED_FLOAT8", path, f"Expected float8 at {path}, got {type(instance).__name__}")
         elif schema_type in ("float", "double"):
             if not isinstance(instance, (int, float)):
-                self.errors.append(f"Expected {schema_type} at {path}, got {type(instance).__name__}")
+                self._error(f"EXPECTED_{schema_type.upper()}", path, f"Expected {schema_type} at {path}, got {type(instance).__name__}")
         elif schema_type == "decimal":
             if not isinstance(instance, str):
-                self.errors.append(f"Expected decimal as string at {path}, got {type(instance).__name__}")
+                self._error("EXPECTED_DECIMAL", path, f"Expected decimal as string at {path}, got {type(instance).__name__}")
             else:
                 try:
                     float(instance)
                 except ValueError:
-                    self.errors.append(f"Invalid decimal format at {path}")
+                    self._error("INVALID_FORMAT", path, f"Invalid decimal format at {path}")
         elif schema_type == "date":
             if not isinstance(instance, str) or not _DATE_REGEX.match(instance):
-                self.errors.append(f"Expected date (YYYY-MM-DD) at {path}")
+                self._error("EXPECTED_DATE", path, f"Expected date (YYYY-MM-DD) at {path}")
         elif schema_type == "datetime":
             if not isinstance(instance, str) or not _DATETIME_REGEX.match(instance):
-                self.errors.append(f"Expected datetime (RFC3339) at {path}")
+                self._error("EXPECTED_DATETIME", path, f"Expected datetime (RFC3339) at {path}")
         elif schema_type == "time":
             if not isinstance(instance, str) or not _TIME_REGEX.match(instance):
-                self.errors.append(f"Expected time (HH:MM:SS) at {path}")
+                self._error("EXPECTED_TIME", path, f"Expected time (HH:MM:SS) at {path}")
         elif schema_type == "duration":
             if not isinstance(instance, str):
-                self.errors.append(f"Expected duration as string at {path}")
+                self._error("EXPECTED_DURATION", path, f"Expected duration as string at {path}")
         elif schema_type == "uuid":
             if not isinstance(instance, str):
-                self.errors.append(f"Expected uuid as string at {path}")
+                self._error("EXPECTED_UUID", path, f"Expected uuid as string at {path}")
             else:
                 try:
                     uuid.UUID(instance)
                 except ValueError:
-                    self.errors.append(f"Invalid uuid format at {path}")
+                    self._error("INVALID_FORMAT", path, f"Invalid uuid format at {path}")
         elif schema_type == "uri":
             if not isinstance(instance, str):
-                self.errors.append(f"Expected uri as string at {path}")
+                self._error("EXPECTED_URI", path, f"Expected uri as string at {path}")
             else:
-                parsed = urlparse(instance)
-                if not parsed.scheme:
-                    self.errors.append(f"Invalid uri format at {path}")
+                if not _has_uri_scheme(instance):
+                    self._error("INVALID_FORMAT", path, f"Invalid uri format at {path}")
         elif schema_type == "binary":
             if not isinstance(instance, str):
-                self.errors.append(f"Expected binary (base64 string) at {path}")
+                self._error("EXPECTED_BINARY", path, f"Expected binary (base64 string) at {path}")
         elif schema_type == "jsonpointer":
             if not isinstance(instance, str) or not _JSONPOINTER_REGEX.match(instance):
-                self.errors.append(f"Expected JSON pointer format at {path}")
+                self._error("EXPECTED_JSONPOINTER", path, f"Expected JSON pointer format at {path}")
         # Compound types.
         elif schema_type == "object":
             # Validate schema: properties MUST have at least one entry if present,
             # unless the schema uses $extends (properties may be inherited)
             if "properties" in schema:
                 props_def = schema["properties"]
-                if not isinstance(props_def, dict) or (len(props_def) == 0 and "$extends" not in schema):
-                    self.errors.append(f"Object schema at {path} has 'properties' but it is empty - properties MUST have at least one entry")
+                if not isinstance(props_def, Mapping) or (len(props_def) == 0 and "$extends" not in schema):
+                    self._error("EMPTY_PROPERTIES", path, f"Object schema at {path} has 'properties' but it is empty - properties MUST have at least one entry")
                     return self.errors
             
             if not isinstance(instance, dict):
-                self.errors.append(f"Expected object at {path}, got {type(instance).__name__}")
+                self._error("EXPECTED_OBJECT", path, f"Expected object at {path}, got {type(instance).__name__}")
             else:
                 props = schema.get("properties", {})
-                req = schema.get("required", [])
-                for r in req:
-                    if r not in instance:
-                        self.errors.append(f"Missing required property '{r}' at {path}")
+                plan = self._plan_for(schema)
+                if plan is not None and plan.required is not None:
+                    missing = plan.required_set.difference(instance)
+                    if missing:
+                        for r in plan.required:
+                            if r in missing:
+                                self._error("MISSING_REQUIRED", path, "Missing required property '{0}' at {path}", (r,))
+                else:
+                    for r in schema.get("required", []):
+                        if r not in instance:
+                            self._error("MISSING_REQUIRED", path, "Missing required property '{0}' at {path}", (r,))
                 for prop, prop_schema in props.items():
                     if prop in instance:
                         self.validate_instance(instance[prop], prop_schema, f"{path}/{prop}")
@@ -410,29 +866,24 @@ class JSONStructureInstanceValidator:
                     if addl is False:
                         for key in instance.keys():
                             if key not in props:
-                                self.errors.append(f"Additional property '{key}' not allowed at {path}")
-                    elif isinstance(addl, dict):
+                                self._error("ADDITIONAL_PROPERTY", path, "Additional property '{0}' not allowed at {path}", (key,))
+                    elif isinstance(addl, Mapping):
                         for key in instance.keys():
                             if key not in props:
                                 self.validate_instance(instance[key], addl, f"{path}/{key}")
                 # Extended object constraint: "has" keyword. [Metaschema: ObjectValidationAddIn]
                 if "has" in schema:
                     has_schema = schema["has"]
-                    valid = any(len(self.validate_instance(val, has_schema, f"{path}/{prop}")) == 0
+                    valid = any(self._matches(val, has_schema, f"{path}/{prop}")
                                 for prop, val in instance.items())
                     if not valid:
-                        self.errors.append(f"Object at {path} does not have any property satisfying 'has' schema")
+                        self._error("HAS_MISMATCH", path, f"Object at {path} does not have any property satisfying 'has' schema")
                 # dependencies (dependentRequired) validation
-                if "dependentRequired" in schema and isinstance(schema["dependentRequired"], dict):
-                    for prop_name, required_deps in schema["dependentRequired"].items():
-                        if prop_name in instance and isinstance(required_deps, list):
-                            for dep in required_deps:
-                                if dep not in instance:
-                                    self.errors.append(
-                                        f"Property '{prop_name}' at {path} requires dependent property '{dep}'")
+                if "dependentRequired" in schema and isinstance(schema["dependentRequired"], Mapping):
+                    self._check_dependent_required(schema, instance, path)
         elif schema_type == "array":
             if not isinstance(instance, list):
-                self.errors.append(f"Expected array at {path}, got {type(instance).__name__}")
+                self._error("EXPECTED_ARRAY", path, f"Expected array at {path}, got {type(instance).__name__}")
             else:
                 items_schema = schema.get("items")
                 if items_schema:
@@ -440,18 +891,17 @@ class JSONStructureInstanceValidator:
                         self.validate_instance(item, items_schema, f"{path}[{idx}]")
         elif schema_type == "set":
             if not isinstance(instance, list):
-                self.errors.append(f"Expected set (unique array) at {path}, got {type(instance).__name__}")
+                self._error("EXPECTED_SET", path, f"Expected set (unique array) at {path}, got {type(instance).__name__}")
             else:
-                serialized = [json.dumps(x, sort_keys=True) for x in instance]
-                if len(serialized) != len(set(serialized)):
-                    self.errors.append(f"Set at {path} contains duplicate items")
+                if _has_duplicates(instance):
+                    self._error("DUPLICATE_ITEMS", path, f"Set at {path} contains duplicate items")
                 items_schema = schema.get("items")
                 if items_schema:
                     for idx, item in enumerate(instance):
                         self.validate_instance(item, items_schema, f"{path}[{idx}]")
         elif schema_type == "map":
             if not isinstance(instance, dict):
-                self.errors.append(f"Expected map (object) at {path}, got {type(instance).__name__}")
+                self._error("EXPECTED_MAP", path, f"Expected map (object) at {path}, got {type(instance).__name__}")
             else:
                 # Map keys MAY be any valid JSON string (no restrictions on key format)
                 values_schema = schema.get("values")
@@ -460,30 +910,30 @@ class JSONStructureInstanceValidator:
                         self.validate_instance(val, values_schema, f"{path}/{key}")
         elif schema_type == "tuple":
             if not isinstance(instance, list):
-                self.errors.append(f"Expected tuple (array) at {path}, got {type(instance).__name__}")
+                self._error("EXPECTED_TUPLE", path, f"Expected tuple (array) at {path}, got {type(instance).__name__}")
             else:
                 # Retrieve the tuple ordering
                 order = schema.get("tuple")
                 props = schema.get("properties", {})
                 if order is None:
-                    self.errors.append(f"Tuple schema at {path} is missing the required 'tuple' keyword for ordering")
+                    self._error("TUPLE_KEYWORD_MISSING", path, f"Tuple schema at {path} is missing the required 'tuple' keyword for ordering")
                 elif not isinstance(order, list):
-                    self.errors.append(f"'tuple' keyword at {path} must be an array of property names")
+                    self._error("INVALID_TUPLE_KEYWORD", path, f"'tuple' keyword at {path} must be an array of property names")
                 else:
                     # Verify each name in order exists in properties
                     for prop_name in order:
                         if prop_name not in props:
-                            self.errors.append(f"Tuple order key '{prop_name}' at {path} not defined in properties")
+                            self._error("TUPLE_KEY_UNDEFINED", path, f"Tuple order key '{prop_name}' at {path} not defined in properties")
                     expected_len = len(order)
                     if len(instance) != expected_len:
-                        self.errors.append(f"Tuple at {path} length {len(instance)} does not equal expected {expected_len}")
+                        self._error("TUPLE_LENGTH", path, f"Tuple at {path} length {len(instance)} does not equal expected {expected_len}")
                     else:
                         for idx, prop_name in enumerate(order):
                             prop_schema = props[prop_name]
                             self.validate_instance(instance[idx], prop_schema, f"{path}/{prop_name}")
         elif schema_type == "choice":
             if not isinstance(instance, dict):
-                self.errors.append(f"Expected choice object at {path}, got {type(instance).__name__}")
+                self._error("EXPECTED_CHOICE", path, f"Expected choice object at {path}, got {type(instance).__name__}")
             else:
                 choices = schema.get("choices", {})
                 extends = schema.get("$extends")
@@ -491,23 +941,23 @@ class JSONStructureInstanceValidator:
                 if extends is None:
                     # Tagged union: exactly one property matching a choice key
                     if len(instance) != 1:
-                        self.errors.append(f"Tagged union at {path} must have a single property")
+                        self._error("CHOICE_NOT_SINGLE", path, f"Tagged union at {path} must have a single property")
                     else:
                         key, value = next(iter(instance.items()))
                         if key not in choices:
-                            self.errors.append(f"Property '{key}' at {path} not one of choices {list(choices.keys())}")
+                            self._error("UNKNOWN_CHOICE", path, f"Property '{key}' at {path} not one of choices {list(choices.keys())}")
                         else:
                             self.validate_instance(value, choices[key], f"{path}/{key}")
                 else:
                     # Inline union: must have selector property
                     if selector is None:
-                        self.errors.append(f"Inline union at {path} missing 'selector' in schema")
+                        self._error("SELECTOR_MISSING", path, f"Inline union at {path} missing 'selector' in schema")
                     else:
                         sel_val = instance.get(selector)
                         if not isinstance(sel_val, str):
-                            self.errors.append(f"Selector '{selector}' at {path} must be a string")
+                            self._error("INVALID_SELECTOR", path, f"Selector '{selector}' at {path} must be a string")
                         elif sel_val not in choices:
-                            self.errors.append(f"Selector '{sel_val}' at {path} not one of choices {list(choices.keys())}")
+                            self._error("UNKNOWN_CHOICE", path, f"Selector '{sel_val}' at {path} not one of choices {list(choices.keys())}")
                         else:
                             # validate remaining properties against chosen variant
                             variant = choices[sel_val]
@@ -515,11 +965,11 @@ class JSONStructureInstanceValidator:
                             inst_copy.pop(selector, None)
                             self.validate_instance(inst_copy, variant, path)
         else:
-            self.errors.append(f"Unsupported type '{schema_type}' at {path}")
+            self._error("UNSUPPORTED_TYPE", path, f"Unsupported type '{schema_type}' at {path}")
 
         # --- Enforce extended features if enabled ---
         # Only enable conditional composition if explicitly enabled via $uses or the validation metaschema
-        schema_uri = self.root_schema.get("$schema", "")
+        schema_uri = root_meta or ""
         is_validation = schema_uri.endswith("/validation/v0/#")
         is_extended = schema_uri.endswith("/extended/v0/#")
         # Only enable if:
@@ -529,35 +979,40 @@ class JSONStructureInstanceValidator:
         enable_conditional = (
             self.extended or
             is_validation or
-            (isinstance(schema, dict) and "$uses" in schema and (
+            (isinstance(schema, Mapping) and "$uses" in schema and (
                 "JSONStructureConditionalComposition" in schema["$uses"] or "JSONStructureValidation" in schema["$uses"]
             ))
         )
         # If the schema is the extended metaschema and has any conditional composition keyword but does NOT have $uses, this is an error (per spec)
         conditional_keywords = ("allOf", "anyOf", "oneOf", "not", "if", "then", "else")
         if is_extended and any(k in schema for k in conditional_keywords):
-            if not (isinstance(schema, dict) and "$uses" in schema and "JSONStructureConditionalComposition" in schema["$uses"]):
-                self.errors.append(
+            if not (isinstance(schema, Mapping) and "$uses" in schema and "JSONStructureConditionalComposition" in schema["$uses"]):
+                self._error("CONDITIONALS_NOT_ENABLED", path,
                     "Conditional composition is not enabled: $uses must include 'JSONStructureConditionalComposition' for the extended metaschema")
                 return self.errors
         if enable_conditional:
             # Conditional composition (allOf, anyOf, oneOf, not, if/then/else)
             if ("JSONStructureConditionalComposition" in self.enabled_extensions or
                 is_validation or
-                (isinstance(schema, dict) and "$uses" in schema and "JSONStructureConditionalComposition" in schema["$uses"])):
+                (isinstance(schema, Mapping) and "$uses" in schema and "JSONStructureConditionalComposition" in schema["$uses"])):
                 self._validate_conditionals(schema, instance, path)
             # Validation keywords (min/max, pattern, etc.)
             if ("JSONStructureValidation" in self.enabled_extensions or
                 is_validation or
-                (isinstance(schema, dict) and "$uses" in schema and "JSONStructureValidation" in schema["$uses"])):
+                (isinstance(schema, Mapping) and "$uses" in schema and "JSONStructureValidation" in schema["$uses"])):
                 self._validate_validation_addins(schema, instance, path)
 
         if "const" in schema:
             if instance != schema["const"]:
-                self.errors.append(f"Value at {path} does not equal const {schema['const']}")
+                self._error("CONST_MISMATCH", path, f"Value at {path} does not equal const {schema['const']}")
         if "enum" in schema:
-            if instance not in schema["enum"]:
-                self.errors.append(f"Value at {path} not in enum {schema['enum']}")
+            plan = self._plan_for(schema)
+            if plan is not None and plan.enum_set is not None and isinstance(instance, _HASHABLE_TYPES):
+                matched = instance in plan.enum_set
+            else:
+                matched = instance in schema["enum"]
+            if not matched:
+                self._error("ENUM_MISMATCH", path, f"Value at {path} not in enum {schema['enum']}")
         return self.errors
 
     def validate(self, instance, schema=None):
@@ -597,8 +1052,7 @@ class JSONStructureInstanceValidator:
                     if len(instance) < schema["minLength"]:
                         errors.append(f"String shorter than minLength {schema['minLength']}")
                 if "pattern" in schema and isinstance(instance, str):
-                    import re
-                    if not re.match(schema["pattern"], instance):
+                    if not _compile_pattern(schema["pattern"]).match(instance):
                         errors.append(f"String does not match pattern {schema['pattern']}")
             if t in ("number", "integer", "float", "double", "float8", "decimal",
                      "int8", "uint8", "int16", "uint16", "int32", "uint32", 
@@ -615,7 +1069,7 @@ class JSONStructureInstanceValidator:
                 if "maxItems" in schema and len(instance) > schema["maxItems"]:
                     errors.append(f"Array has more than maxItems {schema['maxItems']}")
                 if "uniqueItems" in schema and schema["uniqueItems"]:
-                    if len(instance) != len(set(map(str, instance))):
+                    if _has_duplicates(instance):
                         errors.append("Array items are not unique")
         return errors
 
@@ -628,94 +1082,58 @@ class JSONStructureInstanceValidator:
         hasConditionals = False
         if "allOf" in schema:
             hasConditionals = True
-            subschemas = schema["allOf"]
+            # A valid instance is checked once against the merged object schema; any
+            # other instance is validated per subschema so errors keep their allOf[i] path.
+            plan = self._plan_for(schema)
+            merged = plan.all_of_merged if plan is not None else None
+            if (merged is not None and isinstance(instance, dict) and "$uses" not in instance
+                    and self._matches(instance, merged, path)):
+                subschemas = ()
+            else:
+                subschemas = _flatten_composition(schema["allOf"], "allOf")
             for idx, subschema in enumerate(subschemas):
-                backup = list(self.errors)
                 # Ensure subschema inherits validation context from parent
-                enhanced_subschema = dict(subschema)
-                if self.root_schema.get("$uses"):
-                    if "$uses" not in enhanced_subschema:
-                        enhanced_subschema["$uses"] = list(self.root_schema["$uses"])
-                    else:
-                        # Merge validation addins
-                        for addin in self.root_schema["$uses"]:
-                            if addin not in enhanced_subschema["$uses"]:
-                                enhanced_subschema["$uses"].append(addin)
-                self.validate_instance(instance, enhanced_subschema, f"{path}/allOf[{idx}]")
-                if self.errors:
-                    self.errors = backup + self.errors
+                self.validate_instance(instance, self._with_root_uses(subschema), f"{path}/allOf[{idx}]")
         if "anyOf" in schema:
             hasConditionals = True
-            subschemas = schema["anyOf"]
-            valid = False
-            errors_any = []
-            for idx, subschema in enumerate(subschemas):
-                backup = list(self.errors)
-                self.errors = []
-                # Ensure subschema inherits validation context from parent
-                enhanced_subschema = dict(subschema)
-                if self.root_schema.get("$uses"):
-                    if "$uses" not in enhanced_subschema:
-                        enhanced_subschema["$uses"] = list(self.root_schema["$uses"])
-                    else:
-                        # Merge validation addins
-                        for addin in self.root_schema["$uses"]:
-                            if addin not in enhanced_subschema["$uses"]:
-                                enhanced_subschema["$uses"].append(addin)
-                self.validate_instance(instance, enhanced_subschema, f"{path}/anyOf[{idx}]")
-                if not self.errors:
-                    valid = True
-                    break
-                else:
-                    errors_any.append(f"anyOf[{idx}]: {self.errors}")
-                self.errors = backup
-            if not valid:
-                self.errors.append(f"Instance at {path} does not satisfy anyOf: {errors_any}")
+            subschemas = [self._with_root_uses(sub) for sub in _flatten_composition(schema["anyOf"], "anyOf")]
+            if not any(self._matches(instance, sub, f"{path}/anyOf[{idx}]") for idx, sub in enumerate(subschemas)):
+                if self._probing:
+                    raise _FailFast()
+                # Re-validate with messages only to describe the failure.
+                errors_any = [f"anyOf[{idx}]: {self._collect_errors(instance, sub, f'{path}/anyOf[{idx}]')}"
+                              for idx, sub in enumerate(subschemas)]
+                self._error("ANY_OF_MISMATCH", path, f"Instance at {path} does not satisfy anyOf: {errors_any}")
         if "oneOf" in schema:
-            hasConditionals = True	
-            subschemas = schema["oneOf"]
+            hasConditionals = True
+            subschemas = [self._with_root_uses(sub) for sub in schema["oneOf"]]
             valid_count = 0
-            errors_one = []
             for idx, subschema in enumerate(subschemas):
-                backup = list(self.errors)
-                self.errors = []
-                # Ensure subschema inherits validation context from parent
-                enhanced_subschema = dict(subschema)
-                if self.root_schema.get("$uses"):
-                    if "$uses" not in enhanced_subschema:
-                        enhanced_subschema["$uses"] = list(self.root_schema["$uses"])
-                    else:
-                        # Merge validation addins
-                        for addin in self.root_schema["$uses"]:
-                            if addin not in enhanced_subschema["$uses"]:
-                                enhanced_subschema["$uses"].append(addin)
-                self.validate_instance(instance, enhanced_subschema, f"{path}/oneOf[{idx}]")
-                if not self.errors:
+                if self._matches(instance, subschema, f"{path}/oneOf[{idx}]"):
                     valid_count += 1
-                else:
-                    errors_one.append(f"oneOf[{idx}]: {self.errors}")
-                self.errors = backup
+                    if valid_count > 1:
+                        break
             if valid_count != 1:
-                self.errors.append(
+                if self._probing:
+                    raise _FailFast()
+                # Re-validate with messages only to describe the failure.
+                valid_count = 0
+                errors_one = []
+                for idx, subschema in enumerate(subschemas):
+                    sub_errors = self._collect_errors(instance, subschema, f"{path}/oneOf[{idx}]")
+                    if not sub_errors:
+                        valid_count += 1
+                    else:
+                        errors_one.append(f"oneOf[{idx}]: {sub_errors}")
+                self._error("ONE_OF_MISMATCH", path,
                     f"Instance at {path} must match exactly one subschema in oneOf; matched {valid_count}. Details: {errors_one}")
         if "not" in schema:
             hasConditionals = True
-            subschema = schema["not"]
-            backup = list(self.errors)
-            self.errors = []
-            self.validate_instance(instance, subschema, f"{path}/not")
-            if not self.errors:
-                self.errors = backup + [f"Instance at {path} should not validate against 'not' schema"]
-            else:
-                self.errors = backup
+            if self._matches(instance, schema["not"], f"{path}/not"):
+                self._error("NOT_MATCHED", path, f"Instance at {path} should not validate against 'not' schema")
         if "if" in schema:
             hasConditionals = True
-            backup = list(self.errors)
-            self.errors = []
-            self.validate_instance(instance, schema["if"], f"{path}/if")
-            if_valid = not self.errors
-            self.errors = backup
-            if if_valid:
+            if self._matches(instance, schema["if"], f"{path}/if"):
                 if "then" in schema:
                     self.validate_instance(instance, schema["then"], f"{path}/then")
             else:
@@ -728,35 +1146,36 @@ class JSONStructureInstanceValidator:
         Validates additional constraints defined by the JSONStructureValidation addins.
         [Metaschema: JSON Structure JSONStructureValidation]
         """
+        plan = self._plan_for(schema)
+        if plan is not None and plan.value_check is not None and plan.value_check(instance):
+            return
         # Numeric constraints.
-        if schema.get("type") in ("number", "integer", "float", "double", "decimal", 
-                                   "int8", "uint8", "int16", "uint16", "int32", "uint32", 
-                                   "int64", "uint64", "int128", "uint128", "float8"):
+        if schema.get("type") in _ADDIN_NUMERIC_TYPES:
             if "minimum" in schema:
                 try:
                     if instance < schema["minimum"]:
-                        self.errors.append(f"Value at {path} is less than minimum {schema['minimum']}")
+                        self._error("MINIMUM", path, f"Value at {path} is less than minimum {schema['minimum']}")
                 except Exception:
-                    self.errors.append(f"Cannot compare value at {path} with minimum constraint")
+                    self._error("INVALID_CONSTRAINT", path, f"Cannot compare value at {path} with minimum constraint")
             if "maximum" in schema:
                 try:
                     if instance > schema["maximum"]:
-                        self.errors.append(f"Value at {path} is greater than maximum {schema['maximum']}")
+                        self._error("MAXIMUM", path, f"Value at {path} is greater than maximum {schema['maximum']}")
                 except Exception:
-                    self.errors.append(f"Cannot compare value at {path} with maximum constraint")
+                    self._error("INVALID_CONSTRAINT", path, f"Cannot compare value at {path} with maximum constraint")
             if schema.get("exclusiveMinimum") is True:
                 try:
                     if instance <= schema.get("minimum", float("-inf")):
-                        self.errors.append(
+                        self._error("EXCLUSIVE_MINIMUM", path,
                             f"Value at {path} is not greater than exclusive minimum {schema.get('minimum')}")
                 except Exception:
-                    self.errors.append(f"Cannot evaluate exclusiveMinimum constraint at {path}")
+                    self._error("INVALID_CONSTRAINT", path, f"Cannot evaluate exclusiveMinimum constraint at {path}")
             if schema.get("exclusiveMaximum") is True:
                 try:
-                    if instance >= schema.get("maximum", float("inf")):                        self.errors.append(
+                    if instance >= schema.get("maximum", float("inf")):                        self._error("EXCLUSIVE_MAXIMUM", path,
                             f"Value at {path} is not less than exclusive maximum {schema.get('maximum')}")
                 except Exception:
-                    self.errors.append(f"Cannot evaluate exclusiveMaximum constraint at {path}")
+                    self._error("INVALID_CONSTRAINT", path, f"Cannot evaluate exclusiveMaximum constraint at {path}")
             if "multipleOf" in schema:
                 try:
                     # Handle floating point precision issues
@@ -764,68 +1183,65 @@ class JSONStructureInstanceValidator:
                     quotient = instance / multiple_of
                     # Check if the quotient is close to an integer within a small tolerance
                     if abs(quotient - round(quotient)) > 1e-10:
-                        self.errors.append(f"Value at {path} is not a multiple of {schema['multipleOf']}")
+                        self._error("MULTIPLE_OF", path, f"Value at {path} is not a multiple of {schema['multipleOf']}")
                 except Exception:
-                    self.errors.append(f"Cannot evaluate multipleOf constraint at {path}")
+                    self._error("INVALID_CONSTRAINT", path, f"Cannot evaluate multipleOf constraint at {path}")
         
         # String constraints.
         if schema.get("type") == "string":
             if "minLength" in schema:
                 try:
                     if len(instance) < schema["minLength"]:
-                        self.errors.append(f"String at {path} shorter than minLength {schema['minLength']}")
+                        self._error("MIN_LENGTH", path, f"String at {path} shorter than minLength {schema['minLength']}")
                 except TypeError:
-                    self.errors.append(f"Invalid minLength constraint at {path}")
+                    self._error("INVALID_CONSTRAINT", path, f"Invalid minLength constraint at {path}")
             if "maxLength" in schema:
                 try:
                     if len(instance) > schema["maxLength"]:
-                        self.errors.append(f"String at {path} exceeds maxLength {schema['maxLength']}")
+                        self._error("MAX_LENGTH", path, f"String at {path} exceeds maxLength {schema['maxLength']}")
                 except TypeError:
-                    self.errors.append(f"Invalid maxLength constraint at {path}")
+                    self._error("INVALID_CONSTRAINT", path, f"Invalid maxLength constraint at {path}")
             if "pattern" in schema:
                 try:
-                    pattern = re.compile(schema["pattern"])
-                    if not pattern.search(instance):
-                        self.errors.append(f"String at {path} does not match pattern {schema['pattern']}")
+                    if not _compile_pattern(schema["pattern"]).search(instance):
+                        self._error("PATTERN", path, f"String at {path} does not match pattern {schema['pattern']}")
                 except (re.error, TypeError):
-                    self.errors.append(f"Invalid pattern constraint at {path}")
+                    self._error("INVALID_CONSTRAINT", path, f"Invalid pattern constraint at {path}")
             if "format" in schema:
                 fmt = schema["format"]
                 try:
                     if fmt == "email":
                         # Simple email validation
-                        if "@" not in instance or not re.match(r'^[^@]+@[^@]+\.[^@]+$', instance):
-                            self.errors.append(f"String at {path} does not match format email")
+                        if "@" not in instance or not _EMAIL_REGEX.match(instance):
+                            self._error("FORMAT", path, f"String at {path} does not match format email")
                     elif fmt == "ipv4":
                         # IPv4 validation
                         parts = instance.split('.')
                         if len(parts) != 4 or not all(0 <= int(part) <= 255 for part in parts):
-                            self.errors.append(f"String at {path} does not match format ipv4")
+                            self._error("FORMAT", path, f"String at {path} does not match format ipv4")
                     elif fmt == "ipv6":
                         # Basic IPv6 validation
-                        if not re.match(r'^[0-9a-fA-F:]+$', instance):
-                            self.errors.append(f"String at {path} does not match format ipv6")
+                        if not _IPV6_REGEX.match(instance):
+                            self._error("FORMAT", path, f"String at {path} does not match format ipv6")
                     elif fmt == "uri":
-                        parsed = urlparse(instance)
-                        if not parsed.scheme:
-                            self.errors.append(f"String at {path} does not match format uri")
+                        if not _has_uri_scheme(instance):
+                            self._error("FORMAT", path, f"String at {path} does not match format uri")
                     elif fmt == "hostname":
-                        if not re.match(r'^[a-zA-Z0-9.-]+$', instance):
-                            self.errors.append(f"String at {path} does not match format hostname")
+                        if not _HOSTNAME_REGEX.match(instance):
+                            self._error("FORMAT", path, f"String at {path} does not match format hostname")
                     # Add more format validations as needed
                 except (ValueError, TypeError):
-                    self.errors.append(f"String at {path} does not match format {fmt}")        # Array constraints.
+                    self._error("FORMAT", path, f"String at {path} does not match format {fmt}")        # Array constraints.
         if schema.get("type") == "array":
             if "minItems" in schema:
                 if len(instance) < schema["minItems"]:
-                    self.errors.append(f"Array at {path} has fewer items than minItems {schema['minItems']}")
+                    self._error("MIN_ITEMS", path, f"Array at {path} has fewer items than minItems {schema['minItems']}")
             if "maxItems" in schema:
                 if len(instance) > schema["maxItems"]:
-                    self.errors.append(f"Array at {path} has more items than maxItems {schema['maxItems']}")
+                    self._error("MAX_ITEMS", path, f"Array at {path} has more items than maxItems {schema['maxItems']}")
             if schema.get("uniqueItems") is True:
-                serialized = [json.dumps(x, sort_keys=True) for x in instance]
-                if len(serialized) != len(set(serialized)):
-                    self.errors.append(f"Array at {path} does not have unique items")
+                if _has_duplicates(instance):
+                    self._error("UNIQUE_ITEMS", path, f"Array at {path} does not have unique items")
             
             # contains validation
             if "contains" in schema:
@@ -838,81 +1254,83 @@ class JSONStructureInstanceValidator:
                         matches.append(i)
                 
                 if not matches:
-                    self.errors.append(f"Array at {path} does not contain required element")
+                    self._error("CONTAINS", path, f"Array at {path} does not contain required element")
                 
                 # minContains validation
                 if "minContains" in schema:
                     if len(matches) < schema["minContains"]:
-                        self.errors.append(f"Array at {path} contains fewer than minContains {schema['minContains']} matching elements")
+                        self._error("MIN_CONTAINS", path, f"Array at {path} contains fewer than minContains {schema['minContains']} matching elements")
                 
                 # maxContains validation  
                 if "maxContains" in schema:
                     if len(matches) > schema["maxContains"]:
-                        self.errors.append(f"Array at {path} contains more than maxContains {schema['maxContains']} matching elements")
+                        self._error("MAX_CONTAINS", path, f"Array at {path} contains more than maxContains {schema['maxContains']} matching elements")
         # Object constraints.
         if schema.get("type") == "object":
             if "minProperties" in schema:
                 if len(instance.keys()) < schema["minProperties"]:
-                    self.errors.append(
+                    self._error("MIN_PROPERTIES", path,
                         f"Object at {path} has fewer properties than minProperties {schema['minProperties']}")
             if "maxProperties" in schema:
                 if len(instance.keys()) > schema["maxProperties"]:
-                    self.errors.append(
+                    self._error("MAX_PROPERTIES", path,
                         f"Object at {path} has more properties than maxProperties {schema['maxProperties']}")
             
             # patternProperties validation
-            if "patternProperties" in schema and isinstance(schema["patternProperties"], dict):
-                for pattern_str, pattern_schema in schema["patternProperties"].items():
-                    try:
-                        pattern = re.compile(pattern_str)
-                        for prop_name, prop_value in instance.items():
-                            if pattern.search(prop_name):
-                                self.validate_instance(prop_value, pattern_schema, f"{path}/{prop_name}")
-                    except re.error:
-                        self.errors.append(f"Invalid regular expression '{pattern_str}' in patternProperties at {path}")
+            if "patternProperties" in schema and isinstance(schema["patternProperties"], Mapping):
+                plan = self._plan_for(schema)
+                entries = plan.pattern_properties if plan is not None else None
+                if entries is None:
+                    entries = _compile_pattern_entries(schema["patternProperties"])
+                for pattern_str, pattern, pattern_schema in entries:
+                    if pattern is None:
+                        self._error("INVALID_PATTERN", path, f"Invalid regular expression '{pattern_str}' in patternProperties at {path}")
+                        continue
+                    for prop_name, prop_value in instance.items():
+                        if pattern.search(prop_name):
+                            self.validate_instance(prop_value, pattern_schema, f"{path}/{prop_name}")
             
             # propertyNames validation
             if "propertyNames" in schema:
                 property_names_schema = schema["propertyNames"]
-                if not isinstance(property_names_schema, dict) or property_names_schema.get("type") != "string":
-                    self.errors.append(f"propertyNames schema must be of type string at {path}")
+                if not isinstance(property_names_schema, Mapping) or property_names_schema.get("type") != "string":
+                    self._error("INVALID_CONSTRAINT", path, f"propertyNames schema must be of type string at {path}")
                 else:
                     for prop_name in instance.keys():
                         self.validate_instance(prop_name, property_names_schema, f"{path}/propertyName({prop_name})")
                         
             # dependencies (dependentRequired) validation
-            if "dependentRequired" in schema and isinstance(schema["dependentRequired"], dict):
-                for prop_name, required_deps in schema["dependentRequired"].items():
-                    if prop_name in instance and isinstance(required_deps, list):
-                        for dep in required_deps:
-                            if dep not in instance:
-                                self.errors.append(
-                                    f"Property '{prop_name}' at {path} requires dependent property '{dep}'")        # Map constraints
+            if "dependentRequired" in schema and isinstance(schema["dependentRequired"], Mapping):
+                self._check_dependent_required(schema, instance, path)
+        # Map constraints
         if schema.get("type") == "map":
             # minEntries and maxEntries validation
             if "minEntries" in schema:
                 if len(instance) < schema["minEntries"]:
-                    self.errors.append(f"Map at {path} has fewer than minEntries {schema['minEntries']}")
+                    self._error("MIN_ENTRIES", path, f"Map at {path} has fewer than minEntries {schema['minEntries']}")
             if "maxEntries" in schema:
                 if len(instance) > schema["maxEntries"]:
-                    self.errors.append(f"Map at {path} has more than maxEntries {schema['maxEntries']}")
+                    self._error("MAX_ENTRIES", path, f"Map at {path} has more than maxEntries {schema['maxEntries']}")
                     
             # patternKeys validation
-            if "patternKeys" in schema and isinstance(schema["patternKeys"], dict):
-                for pattern_str, pattern_schema in schema["patternKeys"].items():
-                    try:
-                        pattern = re.compile(pattern_str)
-                        for key_name, key_value in instance.items():
-                            if pattern.search(key_name):
-                                self.validate_instance(key_value, pattern_schema, f"{path}/{key_name}")
-                    except re.error:
-                        self.errors.append(f"Invalid regular expression '{pattern_str}' in patternKeys at {path}")
+            if "patternKeys" in schema and isinstance(schema["patternKeys"], Mapping):
+                plan = self._plan_for(schema)
+                entries = plan.pattern_keys if plan is not None else None
+                if entries is None:
+                    entries = _compile_pattern_entries(schema["patternKeys"])
+                for pattern_str, pattern, pattern_schema in entries:
+                    if pattern is None:
+                        self._error("INVALID_PATTERN", path, f"Invalid regular expression '{pattern_str}' in patternKeys at {path}")
+                        continue
+                    for key_name, key_value in instance.items():
+                        if pattern.search(key_name):
+                            self.validate_instance(key_value, pattern_schema, f"{path}/{key_name}")
             
             # keyNames validation
             if "keyNames" in schema:
                 key_names_schema = schema["keyNames"]
-                if not isinstance(key_names_schema, dict) or key_names_schema.get("type") != "string":
-                    self.errors.append(f"keyNames schema must be of type string at {path}")
+                if not isinstance(key_names_schema, Mapping) or key_names_schema.get("type") != "string":
+                    self._error("INVALID_CONSTRAINT", path, f"keyNames schema must be of type string at {path}")
                 else:
                     for key_name in instance.keys():
                         # Ensure validation addins are enabled for keyNames schema validation
@@ -920,20 +1338,53 @@ class JSONStructureInstanceValidator:
                         if "$uses" not in keynames_validation_schema:
                             keynames_validation_schema["$uses"] = ["JSONStructureValidation"]
                         elif "JSONStructureValidation" not in keynames_validation_schema["$uses"]:
-                            keynames_validation_schema["$uses"].append("JSONStructureValidation")
+                            keynames_validation_schema["$uses"] = list(keynames_validation_schema["$uses"]) + ["JSONStructureValidation"]
                         
                         temp_validator = JSONStructureInstanceValidator(keynames_validation_schema, import_map=self.import_map, allow_import=self.allow_import)
                         key_errors = temp_validator.validate_instance(key_name)
                         if key_errors:
-                            self.errors.append(f"Map key name '{key_name}' at {path} does not match keyNames constraint")
+                            self._error("KEY_NAMES", path, f"Map key name '{key_name}' at {path} does not match keyNames constraint")
+
+    def _check_dependent_required(self, schema, instance, path):
+        """
+        Checks dependentRequired: each present trigger property requires its listed
+        dependencies. Missing dependencies are found with one set difference per trigger
+        and reported in the order the schema lists them.
+        :param schema: Object schema with a dependentRequired mapping.
+        :param instance: The object instance.
+        :param path: JSON Pointer of the instance.
+        """
+        plan = self._plan_for(schema)
+        table = plan.dependent_required if plan is not None else None
+        if table is None:
+            for prop_name, deps in schema["dependentRequired"].items():
+                if prop_name in instance and isinstance(deps, list):
+                    for dep in deps:
+                        if dep not in instance:
+                            self._error("DEPENDENT_REQUIRED", path,
+                                "Property '{0}' at {path} requires dependent property '{1}'", (prop_name, dep))
+            return
+        for prop_name, deps, dep_set in table:
+            if prop_name in instance:
+                missing = dep_set.difference(instance)
+                if missing:
+                    for dep in deps:
+                        if dep in missing:
+                            self._error("DEPENDENT_REQUIRED", path,
+                                "Property '{0}' at {path} requires dependent property '{1}'", (prop_name, dep))
 
     def _resolve_ref(self, ref):
         """
         Resolves a $ref within the root schema using JSON Pointer syntax.
         [Metaschema: TypeReference]
+        Successful resolutions are memoized, so each pointer is walked only once
+        per validator.
         :param ref: A JSON pointer string starting with '#'.
         :return: The referenced schema object or None.
         """
+        cached = self._ref_cache.get(ref)
+        if cached is not None:
+            return cached
         if not ref.startswith("#"):
             return None
         parts = ref.lstrip("#").split("/")
@@ -942,12 +1393,32 @@ class JSONStructureInstanceValidator:
             if part == "":
                 continue
             part = part.replace("~1", "/").replace("~0", "~")
-            if isinstance(target, dict) and part in target:
+            if isinstance(target, Mapping) and part in target:
                 target = target[part]
             else:
                 return None
+        self._ref_cache[ref] = target
         return target
 
+    def _check_refs(self, obj, path):
+        """
+        Recursively resolves every $ref and $extends pointer in the schema.
+        Literal instance values (const, enum, default, examples) are not inspected.
+        :param obj: The schema object to check.
+        :param path: JSON Pointer of obj within the root schema.
+        :raises ResolutionError: If a pointer does not resolve.
+        """
+        if isinstance(obj, Mapping):
+            for key, value in obj.items():
+                if key in ("$ref", "$extends") and isinstance(value, str):
+                    if self._resolve_ref(value) is None:
+                        raise self.ResolutionError(f"Cannot resolve {key} {value} at {path}")
+                elif key not in ("const", "enum", "default", "examples"):
+                    self._check_refs(value, f"{path}/{key}")
+        elif isinstance(obj, list):
+            for idx, item in enumerate(obj):
+                self._check_refs(item, f"{path}[{idx}]")
+
     def _rewrite_refs(self, obj, target_path):
         """
         Recursively rewrites $ref pointers in an imported schema to be relative to the target path.
@@ -990,41 +1461,40 @@ class JSONStructureInstanceValidator:
         After merging, $ref pointers in the imported content are rewritten to point
         to their new locations in the merged document.
         """
-        if isinstance(obj, dict):
+        if isinstance(obj, Mapping):
             for key in list(obj.keys()):
                 if key in ("$import", "$importdefs"):
                     if not self.allow_import:
-                        self.errors.append(
+                        self._error("IMPORT_NOT_ALLOWED", f"{path}/{key}",
                             f"JSONStructureImport keyword '{key}' encountered but allow_import not enabled at {path}/{key}")
                         continue
                     uri = obj[key]
                     if not isinstance(uri, str):
-                        self.errors.append(f"JSONStructureImport keyword '{key}' value must be a string URI at {path}/{key}")
+                        self._error("INVALID_IMPORT_URI", f"{path}/{key}", f"JSONStructureImport keyword '{key}' value must be a string URI at {path}/{key}")
                         continue
-                    if not self.ABSOLUTE_URI_REGEX.search(uri):
-                        self.errors.append(f"JSONStructureImport keyword '{key}' value must be an absolute URI at {path}/{key}")
+                    if not self.ABSOLUTE_URI_REGEX.match(uri):
+                        self._error("INVALID_IMPORT_URI", f"{path}/{key}", f"JSONStructureImport keyword '{key}' value must be an absolute URI at {path}/{key}")
                         continue
                     external = self._fetch_external_schema(uri)
                     if external is None:
-                        self.errors.append(f"Unable to fetch external schema from {uri} at {path}/{key}")
+                        self._error("IMPORT_UNRESOLVED", f"{path}/{key}", f"Unable to fetch external schema from {uri} at {path}/{key}")
                         continue
                     if key == "$import":
                         imported_defs = {}
                         if "type" in external and "name" in external:
                             imported_defs[external["name"]] = external
-                        if "definitions" in external and isinstance(external["definitions"], dict):
+                        if "definitions" in external and isinstance(external["definitions"], Mapping):
                             imported_defs.update(external["definitions"])
                     else:  # $importdefs
-                        if "definitions" in external and isinstance(external["definitions"], dict):
-                            imported_defs = external["definitions"]
+                        if "definitions" in external and isinstance(external["definitions"], Mapping):
+                            imported_defs = dict(external["definitions"])
                         else:
                             imported_defs = {}
                     # Rewrite $ref pointers in imported content to point to their new location
                     for k, v in imported_defs.items():
-                        if isinstance(v, dict):
-                            # Deep copy to avoid modifying cached schemas
-                            import copy
-                            v = copy.deepcopy(v)
+                        if isinstance(v, Mapping):
+                            # Copy to avoid modifying cached or read-only schemas
+                            v = _thaw(v)
                             self._rewrite_refs(v, path)
                             imported_defs[k] = v
                     for k, v in imported_defs.items():
@@ -1051,10 +1521,9 @@ class JSONStructureInstanceValidator:
         # Then check import_map for file paths
         if uri in self.import_map:
             try:
-                with open(self.import_map[uri], "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return load_import_file(self.import_map[uri])
             except Exception as e:
-                self.errors.append(f"Failed to load imported schema from {self.import_map[uri]}: {e}")
+                self._error("IMPORT_LOAD_FAILED", None, f"Failed to load imported schema from {self.import_map[uri]}: {e}")
                 return None
         # URI not found in external_schemas or import_map
         return None
@@ -1076,40 +1545,41 @@ class JSONStructureInstanceValidator:
             uses = [uses]
         offers = self.root_schema.get("$offers", {})
         merged = dict(schema)
-        merged.setdefault("properties", {})
+        # Copy the properties so merging add-ins never alters the caller's schema.
+        merged["properties"] = dict(schema.get("properties", {}))
         for use in [u for u in uses if not u in ["JSONStructureValidation", "JSONStructureConditionalComposition", "JSONStructureAlternateNames", "JSONStructureUnits"]]:
             if use not in offers:
-                self.errors.append(f"Add-in '{use}' not offered in $offers")
+                self._error("ADDIN_NOT_OFFERED", None, f"Add-in '{use}' not offered in $offers")
                 continue
             addin = offers[use]
             if isinstance(addin, list):
                 for ref in addin:
                     resolved = self._resolve_ref(ref) if isinstance(ref, str) else ref
-                    if isinstance(resolved, dict):
+                    if isinstance(resolved, Mapping):
                         addin_props = resolved.get("properties", {})
                         for prop in addin_props:
                             if prop in merged["properties"]:
-                                self.errors.append(
+                                self._error("ADDIN_CONFLICT", None,
                                     f"Add-in property '{prop}' from add-in '{use}' conflicts with existing property")
                         merged["properties"].update(addin_props)
-            elif isinstance(addin, dict) and "$ref" in addin:
+            elif isinstance(addin, Mapping) and "$ref" in addin:
                 resolved = self._resolve_ref(addin["$ref"])
-                if isinstance(resolved, dict):
+                if isinstance(resolved, Mapping):
                     addin_props = resolved.get("properties", {})
                     for prop in addin_props:
                         if prop in merged["properties"]:
-                            self.errors.append(
+                            self._error("ADDIN_CONFLICT", None,
                                 f"Add-in property '{prop}' from add-in '{use}' conflicts with existing property")
                     merged["properties"].update(addin_props)
-            elif isinstance(addin, dict):
+            elif isinstance(addin, Mapping):
                 addin_props = addin.get("properties", {})
                 for prop in addin_props:
                     if prop in merged["properties"]:
-                        self.errors.append(
+                        self._error("ADDIN_CONFLICT", None,
                             f"Add-in property '{prop}' from add-in '{use}' conflicts with existing property")
                 merged["properties"].update(addin_props)
             else:
-                self.errors.append(f"Invalid add-in definition for '{use}'")
+                self._error("INVALID_ADDIN", None, f"Invalid add-in definition for '{use}'")
         return merged
 
 
@@ -1120,11 +1590,10 @@ def main():
     parser.add_argument('schema_file')
     parser.add_argument('--extended', action='store_true')
     args = parser.parse_args()
-    import json
-    with open(args.schema_file, 'r', encoding='utf-8') as f:
-        schema = json.load(f)
-    with open(args.instance_file, 'r', encoding='utf-8') as f:
-        instance = json.load(f)
+    with open(args.schema_file, 'rb') as f:
+        schema = parse_json(f.read())
+    with open(args.instance_file, 'rb') as f:
+        instance = parse_json(f.read())
     validator = JSONStructureInstanceValidator(schema, extended=args.extended)
     errors = validator.validate(instance)
     if errors:
@@ -0,0 +1,63 @@
+# encoding: utf-8
+"""
+json_structure_loader.py
+
+JSON file parsing shared by the schema and instance validators. Documents are
+parsed with orjson when it is installed and with the standard json module
+otherwise; either way the parsed values are the ones json.loads() produces.
+"""
+
+import json
+import os
+import re
+
+try:
+    import orjson
+except ImportError:  # optional; the json module is used instead
+    orjson = None
+
+# orjson turns integers outside the 64-bit range into floats; documents with runs
+# of 19 or more digits are left to the json module, which keeps them exact.
+_LONG_DIGITS_REGEX = re.compile(rb'\d{19}')
+
+# Parsed import-map files by (absolute path, mtime, size); oldest entries are evicted first.
+_IMPORT_FILES = {}
+_IMPORT_FILES_SIZE = 64
+
+
+def parse_json(data):
+    """
+    Parses a JSON document with orjson when it is installed. Documents orjson rejects
+    (NaN, lone surrogates, malformed input) or might read differently are parsed with
+    the json module, so results and errors match json.loads().
+    :param data: The document as UTF-8 bytes.
+    :return: The parsed value.
+    """
+    if orjson is not None and not _LONG_DIGITS_REGEX.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def load_import_file(file_path):
+    """
+    Parses a schema file named in an import map. Parsed files are shared by all
+    validators until the file's modification time or size changes, so validating
+    many schemas that import the same files reads and parses each file once.
+    Callers copy imported definitions before rewriting them; the cached schema is
+    never modified.
+    :param file_path: Path of the schema file.
+    :return: The parsed schema.
+    """
+    stat = os.stat(file_path)
+    key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    schema = _IMPORT_FILES.get(key)
+    if schema is None:
+        with open(file_path, "rb") as f:
+            schema = parse_json(f.read())
+        if len(_IMPORT_FILES) >= _IMPORT_FILES_SIZE:
+            del _IMPORT_FILES[next(iter(_IMPORT_FILES))]
+        _IMPORT_FILES[key] = schema
+    return schema
@@ -21,7 +21,12 @@ If a URI mapping is provided via --importmap, the external schema file is loaded
 import sys
 import json
 import re
-from urllib.parse import urlparse
+
+from json_structure_loader import load_import_file
+
+
+class _FailFast(Exception):
+    """Raised by _err to stop validation at the first error in fail_fast mode."""
 
 
 class JSONStructureSchemaCoreValidator:
@@ -72,7 +77,7 @@ class JSONStructureSchemaCoreValidator:
         "JSONStructureConditionalComposition", "JSONStructureValidation"
     }
 
-    def __init__(self, allow_dollar=False, allow_import=False, import_map=None, extended=False, external_schemas=None):
+    def __init__(self, allow_dollar=False, allow_import=False, import_map=None, extended=False, external_schemas=None, fail_fast=False):
         """
         Initializes a validator instance.
         :param allow_dollar: Boolean flag to allow '$' in property names.
@@ -81,6 +86,7 @@ class JSONStructureSchemaCoreValidator:
         :param extended: Boolean flag to enable extended validation features.
         :param external_schemas: List of schema dicts to use for resolving imports by $id.
                                  Each schema should have a '$id' field matching the import URI.
+        :param fail_fast: Boolean flag to stop at the first error, for callers that only need to know whether the document is valid.
         """
         self.errors = []
         self.doc = None
@@ -88,6 +94,7 @@ class JSONStructureSchemaCoreValidator:
         self.allow_import = allow_import
         self.import_map = import_map if import_map is not None else {}
         self.extended = extended
+        self.fail_fast = fail_fast
         self.enabled_extensions = set()
         # Build lookup for external schemas by $id
         self.external_schemas = {}
@@ -95,6 +102,20 @@ class JSONStructureSchemaCoreValidator:
             for schema in external_schemas:
                 if isinstance(schema, dict) and "$id" in schema:
                     self.external_schemas[schema["$id"]] = schema
+        # Schema objects waiting to be checked; see _validate_schema.
+        self._pending = []
+        self._draining = False
+        # Compound type checkers by type name; "any" has nothing to check and other
+        # recognized names are primitives.
+        self._type_checkers = {
+            "any": None,
+            "object": self._check_object_schema,
+            "array": self._check_array_schema,
+            "set": self._check_set_schema,
+            "map": self._check_map_schema,
+            "tuple": self._check_tuple_schema,
+            "choice": self._check_choice_schema,
+        }
         if allow_dollar:
             self.identifier_regex = re.compile(r'^[A-Za-z_$][A-Za-z0-9_$]*$')
         else:
@@ -105,15 +126,26 @@ class JSONStructureSchemaCoreValidator:
         Main entry point for validating a JSON Structure Core document.
         :param doc: A dict parsed from JSON.
         :param source_text: The original JSON text for computing line and column.
-        :return: List of error messages, empty if valid.
+                            If omitted, doc is serialized the first time an error needs a location.
+        :return: List of error messages, empty if valid. In fail_fast mode, at most one message.
         """
         self.errors = []
         self.doc = doc
         self.source_text = source_text
+        self._pending.clear()
+        try:
+            self._validate_document(doc)
+        except _FailFast:
+            pass
+        return self.errors
 
+    def _validate_document(self, doc):
+        """
+        Runs all document-level checks for validate().
+        """
         if not isinstance(doc, dict):
             self._err("Root of the document must be a JSON object.", "#")
-            return self.errors
+            return
 
         # Process $import and $importdefs keywords recursively.
         self._process_imports(doc, "#")
@@ -146,8 +178,6 @@ class JSONStructureSchemaCoreValidator:
         # Check for composition keywords at root if no type is present
         if self.extended and "type" not in doc:
             self._check_composition_keywords(doc, "#")
-            
-        return self.errors
 
     def _check_enabled_extensions(self, doc):
         """
@@ -199,7 +229,7 @@ class JSONStructureSchemaCoreValidator:
         if not isinstance(value, str):
             self._err(f"'{keyword_name}' must be a string.", location)
             return
-        if not self.ABSOLUTE_URI_REGEX.search(value):
+        if not self.ABSOLUTE_URI_REGEX.match(value):
             self._err(f"'{keyword_name}' must be an absolute URI.", location)
 
     def _rewrite_refs(self, obj, target_path):
@@ -237,62 +267,67 @@ class JSONStructureSchemaCoreValidator:
 
     def _process_imports(self, obj, path):
         """
-        Recursively processes $import and $importdefs keywords.
+        Processes $import and $importdefs keywords at every level of obj.
         If allow_import is False, an error is reported.
         Otherwise, external schemas are fetched and their definitions merged into the current object.
         This merging is done in-place so that imported definitions appear as if they were defined locally.
         After merging, $ref pointers in the imported content are rewritten to point to their new locations.
+        The document is walked with an explicit stack, in the same depth-first order as a
+        recursive walk, so that deeply nested documents cannot exhaust the Python stack.
         """
-        if isinstance(obj, dict):
-            # Process import keywords at current level.
-            for key in list(obj.keys()):
-                if key in ("$import", "$importdefs"):
-                    if not self.allow_import:
-                        self._err(f"JSONStructureImport keyword '{key}' encountered but allow_import not enabled.", f"{path}/{key}")
-                        continue
-                    uri = obj[key]
-                    if not isinstance(uri, str):
-                        self._err(f"JSONStructureImport keyword '{key}' value must be a string URI.", f"{path}/{key}")
-                        continue
-                    if not self.ABSOLUTE_URI_REGEX.search(uri):
-                        self._err(f"JSONStructureImport keyword '{key}' value must be an absolute URI.", f"{path}/{key}")
-                        continue
-                    external = self._fetch_external_schema(uri)
-                    if external is None:
-                        self._err(f"Unable to fetch external schema from {uri}.", f"{path}/{key}")
-                        continue
-                    if key == "$import":
-                        imported_defs = {}
-                        # Import root type if available.
-                        if "type" in external and "name" in external:
-                            imported_defs[external["name"]] = external
-                        # Also import definitions from definitions if available.
-                        if "definitions" in external and isinstance(external["definitions"], dict):
-                            imported_defs.update(external["definitions"])
-                    else:  # $importdefs
-                        if "definitions" in external and isinstance(external["definitions"], dict):
-                            imported_defs = external["definitions"]
-                        else:
+        stack = [(obj, path)]
+        while stack:
+            obj, path = stack.pop()
+            if isinstance(obj, dict):
+                # Process import keywords at current level.
+                for key in list(obj.keys()):
+                    if key in ("$import", "$importdefs"):
+                        if not self.allow_import:
+                            self._err(f"JSONStructureImport keyword '{key}' encountered but allow_import not enabled.", f"{path}/{key}")
+                            continue
+                        uri = obj[key]
+                        if not isinstance(uri, str):
+                            self._err(f"JSONStructureImport keyword '{key}' value must be a string URI.", f"{path}/{key}")
+                            continue
+                        if not self.ABSOLUTE_URI_REGEX.match(uri):
+                            self._err(f"JSONStructureImport keyword '{key}' value must be an absolute URI.", f"{path}/{key}")
+                            continue
+                        external = self._fetch_external_schema(uri)
+                        if external is None:
+                            self._err(f"Unable to fetch external schema from {uri}.", f"{path}/{key}")
+                            continue
+                        if key == "$import":
                             imported_defs = {}
-                    # Rewrite $ref pointers in imported content to point to their new location
-                    for k, v in imported_defs.items():
-                        if isinstance(v, dict):
-                            # Deep copy to avoid modifying cached schemas
-                            import copy
-                            v = copy.deepcopy(v)
-                            self._rewrite_refs(v, path)
-                            imported_defs[k] = v
-                    # Merge imported definitions directly into the current object.
-                    for k, v in imported_defs.items():
-                        if k not in obj:
-                            obj[k] = v
-                    del obj[key]
-            # Recurse into all values.
-            for key, value in obj.items():
-                self._process_imports(value, f"{path}/{key}")
-        elif isinstance(obj, list):
-            for idx, item in enumerate(obj):
-                self._process_imports(item, f"{path}[{idx}]")
+                            # Import root type if available.
+                            if "type" in external and "name" in external:
+                                imported_defs[external["name"]] = external
+                            # Also import definitions from definitions if available.
+                            if "definitions" in external and isinstance(external["definitions"], dict):
+                                imported_defs.update(external["definitions"])
+                        else:  # $importdefs
+                            if "definitions" in external and isinstance(external["definitions"], dict):
+                                imported_defs = dict(external["definitions"])
+                            else:
+                                imported_defs = {}
+                        # Rewrite $ref pointers in imported content to point to their new location
+                        for k, v in imported_defs.items():
+                            if isinstance(v, dict):
+                                # Deep copy to avoid modifying cached schemas
+                                import copy
+                                v = copy.deepcopy(v)
+                                self._rewrite_refs(v, path)
+                                imported_defs[k] = v
+                        # Merge imported definitions directly into the current object.
+                        for k, v in imported_defs.items():
+                            if k not in obj:
+                                obj[k] = v
+                        del obj[key]
+                # Visit all values, first key first.
+                for key, value in reversed(list(obj.items())):
+                    stack.append((value, f"{path}/{key}"))
+            elif isinstance(obj, list):
+                for idx in range(len(obj) - 1, -1, -1):
+                    stack.append((obj[idx], f"{path}[{idx}]"))
 
     def _fetch_external_schema(self, uri):
         """
@@ -307,8 +342,7 @@ class JSONStructureSchemaCoreValidator:
         # Then check import_map for file paths
         if uri in self.import_map:
             try:
-                with open(self.import_map[uri], "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return load_import_file(self.import_map[uri])
             except Exception as e:
                 self._err(f"Failed to load imported schema from {self.import_map[uri]}: {e}", "#/import")
                 return None
@@ -342,6 +376,29 @@ class JSONStructureSchemaCoreValidator:
     def _validate_schema(self, schema_obj, is_root=False, path="", name_in_namespace=None):
         """
         Validates an individual schema object.
+        Nested schemas reached while checking it are pushed onto a stack rather than
+        validated recursively, so the outermost call works through the stack in a flat
+        loop and deeply nested documents cannot exhaust the Python stack. The schemas
+        pushed while checking one object are reversed so that they are checked first to
+        last, depth first, in the order the recursive walk used.
+        """
+        self._pending.append((schema_obj, is_root, path, name_in_namespace))
+        if self._draining:
+            return
+        self._draining = True
+        try:
+            stack = self._pending
+            while stack:
+                item = stack.pop()
+                mark = len(stack)
+                self._check_schema_object(*item)
+                stack[mark:] = reversed(stack[mark:])
+        finally:
+            self._draining = False
+
+    def _check_schema_object(self, schema_obj, is_root, path, name_in_namespace):
+        """
+        Checks the keywords of one schema object; called only by _validate_schema.
         """
         if not isinstance(schema_obj, dict):
             self._err(f"{path} must be an object to be a schema.", path)
@@ -408,26 +465,14 @@ class JSONStructureSchemaCoreValidator:
                 if not isinstance(tval, str):
                     self._err("Type must be a string, list, or object with $ref.", path + "/type")
                 else:
-                    if (tval not in self.PRIMITIVE_TYPES and
-                        tval not in self.COMPOUND_TYPES):
-                        self._err(f"Type '{tval}' is not a recognized primitive or compound type.", path + "/type")
+                    if tval in self._type_checkers:
+                        checker = self._type_checkers[tval]
+                        if checker is not None:
+                            checker(schema_obj, path)
+                    elif tval in self.PRIMITIVE_TYPES:
+                        self._check_primitive_schema(schema_obj, path)
                     else:
-                        if tval == "any":
-                            pass
-                        elif tval == "object":
-                            self._check_object_schema(schema_obj, path)
-                        elif tval == "array":
-                            self._check_array_schema(schema_obj, path)
-                        elif tval == "set":
-                            self._check_set_schema(schema_obj, path)
-                        elif tval == "map":
-                            self._check_map_schema(schema_obj, path)
-                        elif tval == "tuple":
-                            self._check_tuple_schema(schema_obj, path)
-                        elif tval == "choice":
-                            self._check_choice_schema(schema_obj, path)
-                        else:
-                            self._check_primitive_schema(schema_obj, path)
+                        self._err(f"Type '{tval}' is not a recognized primitive or compound type.", path + "/type")
                             
         # Extended validation checks
         if self.extended and "type" in schema_obj:
@@ -912,6 +957,11 @@ class JSONStructureSchemaCoreValidator:
         Heuristically locates the first occurrence of the JSON pointer path in the source text.
         Returns a tuple (line, column) if found, or None.
         """
+        if self.source_text is None:
+            try:
+                self.source_text = json.dumps(self.doc)
+            except (TypeError, ValueError, RecursionError):
+                self.source_text = ""
         if not self.source_text or not pointer.startswith("#"):
             return None
         parts = pointer[1:].split("/")
@@ -940,21 +990,48 @@ class JSONStructureSchemaCoreValidator:
         else:
             full_msg = f"{message} (Location: {location}, line/column unknown)"
         self.errors.append(full_msg)
+        if self.fail_fast:
+            raise _FailFast()
 
 
-def validate_json_structure_schema_core(schema_document, source_text=None, allow_dollar=False, allow_import=False, import_map=None, extended=False):
+# Results of validate_json_structure_schema_core keyed by the document and the
+# options it was checked with; oldest entries are evicted first.
+_RESULT_CACHE = {}
+_RESULT_CACHE_SIZE = 256
+
+
+def validate_json_structure_schema_core(schema_document, source_text=None, allow_dollar=False, allow_import=False, import_map=None, extended=False, fail_fast=False):
     """
     Validates the provided schema_document dict against the JSON Structure Core specification.
     :param schema_document: Parsed JSON Structure document.
-    :param source_text: Original JSON text.
+    :param source_text: Original JSON text; serialized from schema_document when needed if omitted.
     :param allow_dollar: Allow '$' in property names.
     :param allow_import: Enable processing of $import/$importdefs keywords.
     :param import_map: Dictionary mapping URI to local filenames.
     :param extended: Enable extended validation features.
+    :param fail_fast: Stop at the first error.
     :return: List of error strings; empty if valid.
     """
-    validator = JSONStructureSchemaCoreValidator(allow_dollar=allow_dollar, allow_import=allow_import, import_map=import_map, extended=extended)
-    return validator.validate(schema_document, source_text)
+    # Documents that pull in external schemas are never cached: their result also
+    # depends on the imported files. Documents too deeply nested to repr() are not
+    # cached either.
+    key = None
+    if not allow_import:
+        try:
+            key = (repr(schema_document), source_text, allow_dollar, extended, fail_fast)
+        except RecursionError:
+            pass
+    if key is None:
+        validator = JSONStructureSchemaCoreValidator(allow_dollar=allow_dollar, allow_import=allow_import, import_map=import_map, extended=extended, fail_fast=fail_fast)
+        return validator.validate(schema_document, source_text)
+    errors = _RESULT_CACHE.get(key)
+    if errors is None:
+        validator = JSONStructureSchemaCoreValidator(allow_dollar=allow_dollar, extended=extended, fail_fast=fail_fast)
+        errors = tuple(validator.validate(schema_document, source_text))
+        if len(_RESULT_CACHE) >= _RESULT_CACHE_SIZE:
+            del _RESULT_CACHE[next(iter(_RESULT_CACHE))]
+        _RESULT_CACHE[key] = errors
+    return list(errors)
 
 
 def main():
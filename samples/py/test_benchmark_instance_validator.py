@@ -0,0 +1,104 @@
+# encoding: utf-8
+"""
+test_benchmark_instance_validator.py
+
+Micro-benchmarks for json_structure_instance_validator.py using pytest-benchmark.
+Each benchmark validates a representative, valid instance against a validator
+that is constructed once, so only the validate_instance hot path is timed:
+  - primitive: single primitive type checks.
+  - object: properties, required and additionalProperties.
+  - union: type unions resolved by trial validation.
+  - ref: $ref resolution through definitions.
+
+The module is skipped when pytest-benchmark is not installed. Run it on its own with
+    pytest test_benchmark_instance_validator.py --benchmark-only
+and compare runs with --benchmark-autosave / --benchmark-compare.
+"""
+
+import pytest
+from json_structure_instance_validator import JSONStructureInstanceValidator
+
+pytest.importorskip("pytest_benchmark")
+
+CORE_META = "https://json-structure.org/meta/core/v0/#"
+
+
+def _prim(type_name):
+    return {"$schema": CORE_META, "$id": "dummy", "name": f"{type_name}Schema", "type": type_name}
+
+
+def _run(benchmark, schema, instance):
+    validator = JSONStructureInstanceValidator(schema)
+    errors = benchmark(validator.validate_instance, instance)
+    assert errors == []
+
+
+@pytest.mark.benchmark(group="primitive")
+@pytest.mark.parametrize("type_name,instance", [
+    ("string", "hello"),
+    ("int32", 123456),
+    ("double", 3.14),
+    ("datetime", "2025-02-01T12:00:00Z"),
+    ("uuid", "550e8400-e29b-41d4-a716-446655440000"),
+])
+def test_benchmark_primitive(benchmark, type_name, instance):
+    _run(benchmark, _prim(type_name), instance)
+
+
+@pytest.mark.benchmark(group="object")
+def test_benchmark_object(benchmark):
+    schema = {
+        "$schema": CORE_META,
+        "$id": "dummy",
+        "name": "objSchema",
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "age": {"type": "int32"},
+            "email": {"type": "string"},
+            "tags": {"type": "array", "items": {"type": "string"}}
+        },
+        "required": ["name", "age"],
+        "additionalProperties": False
+    }
+    instance = {"name": "Alice", "age": 30, "email": "alice@example.com", "tags": ["a", "b", "c"]}
+    _run(benchmark, schema, instance)
+
+
+@pytest.mark.benchmark(group="union")
+def test_benchmark_union(benchmark):
+    schema = {
+        "$schema": CORE_META,
+        "$id": "dummy",
+        "name": "unionSchema",
+        "type": "array",
+        "items": {"type": ["string", "int32", "boolean"]}
+    }
+    _run(benchmark, schema, ["a", 1, True, "b", 2, False])
+
+
+@pytest.mark.benchmark(group="ref")
+def test_benchmark_ref(benchmark):
+    schema = {
+        "$schema": CORE_META,
+        "$id": "dummy",
+        "name": "refSchema",
+        "type": "object",
+        "properties": {
+            "home": {"type": {"$ref": "#/definitions/Address"}},
+            "work": {"type": {"$ref": "#/definitions/Address"}}
+        },
+        "definitions": {
+            "Address": {
+                "name": "Address",
+                "type": "object",
+                "properties": {
+                    "street": {"type": "string"},
+                    "city": {"type": "string"}
+                },
+                "required": ["street", "city"]
+            }
+        }
+    }
+    address = {"street": "1 Main St", "city": "Springfield"}
+    _run(benchmark, schema, {"home": address, "work": address})
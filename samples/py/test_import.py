@@ -77,3 +77,51 @@ def test_import_with_temp_files(tmp_path):
     source_text = json.dumps(local_schema)
     errors = validate_json_structure_schema_core(local_schema, source_text, allow_import=True, import_map=import_map)
     assert errors == []
+
+
+def test_import_files_parsed_once(tmp_path, monkeypatch):
+    """
+    Test that an imported file is parsed once for repeated validations and re-read
+    after it changes.
+    """
+    import json_structure_loader
+    external_schema = {
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "https://example.com/schema/address",
+        "definitions": {
+            "Address": {"name": "Address", "type": "object", "properties": {"street": {"type": "string"}}}
+        }
+    }
+    address_file = tmp_path / "address.json"
+    address_file.write_text(json.dumps(external_schema), encoding="utf-8")
+    local_schema = {
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "https://example.com/schema/local",
+        "name": "LocalSchema",
+        "type": "object",
+        "properties": {"address": {"type": {"$ref": "#/definitions/Addresses/Address"}}},
+        "definitions": {"Addresses": {"$importdefs": "https://example.com/schema/address"}}
+    }
+    import_map = {"https://example.com/schema/address": str(address_file)}
+    loads = []
+    real_parse = json_structure_loader.parse_json
+    monkeypatch.setattr(json_structure_loader, "parse_json", lambda data: loads.append(data) or real_parse(data))
+    for _ in range(3):
+        assert validate_json_structure_schema_core(json.loads(json.dumps(local_schema)), allow_import=True,
+                                                   import_map=import_map) == []
+    assert len(loads) == 1
+    external_schema["definitions"]["Address"]["properties"]["city"] = {"type": "string"}
+    address_file.write_text(json.dumps(external_schema), encoding="utf-8")
+    assert validate_json_structure_schema_core(local_schema, allow_import=True, import_map=import_map) == []
+    assert len(loads) == 2
+
+
+def test_import_file_parsing_matches_json_module():
+    """
+    Test that imported files parse as with the json module, including documents
+    orjson rejects or would read differently.
+    """
+    from json_structure_loader import parse_json
+    for text in ['{"a": [1, 2.5, "x", null]}', '{"big": 340282366920938463463374607431768211455}',
+                 '[-9223372036854775809]', '[NaN]', '[1e400]']:
+        assert repr(parse_json(text.encode("utf-8"))) == repr(json.loads(text))
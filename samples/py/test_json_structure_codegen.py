@@ -0,0 +1,116 @@
+# encoding: utf-8
+"""
+test_json_structure_codegen.py
+
+Pytest-based test suite for json_structure_codegen.py.
+Every compiled predicate must agree with the instance validator: True exactly when
+the validator reports no errors. Schemas outside the compiled subset must not compile.
+"""
+
+import pytest
+from json_structure_codegen import compile_schema
+from json_structure_instance_validator import JSONStructureInstanceValidator
+
+CORE_META = "https://json-structure.org/meta/core/v0/#"
+
+PERSON_SCHEMA = {
+    "$schema": CORE_META,
+    "$id": "dummy",
+    "name": "Person",
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "age": {"type": "uint8"},
+        "id": {"type": "uuid"},
+        "score": {"type": "number"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "labels": {"type": "map", "values": {"type": "int32"}},
+        "address": {"type": {"$ref": "#/definitions/Address"}},
+        "extra": {"type": "any"}
+    },
+    "required": ["name", "age"],
+    "additionalProperties": False,
+    "definitions": {
+        "Address": {
+            "name": "Address",
+            "type": "object",
+            "properties": {
+                "street": {"type": "string"},
+                "next": {"type": {"$ref": "#/definitions/Address"}}
+            }
+        }
+    }
+}
+
+
+def _interpreted_errors(schema, instance):
+    validator = JSONStructureInstanceValidator(schema)
+    validator._compiled = None
+    return validator.validate_instance(instance)
+
+
+@pytest.mark.parametrize("instance", [
+    {"name": "Ann", "age": 30},
+    {"name": "Ann", "age": 30, "id": "550e8400-e29b-41d4-a716-446655440000", "score": 1.5,
+     "tags": ["a"], "labels": {"x": 1}, "extra": [1, {"k": None}]},
+    {"name": "Ann", "age": 30, "address": {"street": "Main", "next": {"next": {"street": "Side"}}}},
+    {"name": "Ann"},
+    {"name": "Ann", "age": 256},
+    {"name": "Ann", "age": 30, "id": "not-a-uuid"},
+    {"name": "Ann", "age": 30, "score": True},
+    {"name": "Ann", "age": 30, "tags": ["a", 1]},
+    {"name": "Ann", "age": 30, "labels": {"x": "1"}},
+    {"name": "Ann", "age": 30, "address": {"next": {"street": 5}}},
+    {"name": "Ann", "age": 30, "nickname": "A"},
+    {"name": "Ann", "age": 30, "extra": {"$uses": ["JSONStructureValidation"]}},
+    {"name": "Ann", "age": 30, "$uses": ["JSONStructureValidation"]},
+    ["Ann", 30],
+])
+def test_compiled_agrees_with_validator(instance):
+    check = compile_schema(PERSON_SCHEMA)
+    assert check is not None
+    assert check(instance) == (_interpreted_errors(PERSON_SCHEMA, instance) == [])
+
+
+@pytest.mark.parametrize("extra", [
+    {"type": ["string", "null"]},
+    {"type": "date"},
+    {"type": "set", "items": {"type": "string"}},
+    {"type": "string", "enum": ["a"]},
+    {"type": "string", "const": "a"},
+    {"type": "object", "properties": {"a": {"type": "string"}}, "abstract": True},
+    {"type": "object", "properties": {}},
+    {"type": "string", "$uses": ["JSONStructureValidation"]},
+    {"$ref": "#/definitions/Missing"},
+])
+def test_unsupported_schema_not_compiled(extra):
+    schema = {"$schema": CORE_META, "$id": "dummy", "name": "Unsupported", "definitions": {}, **extra}
+    assert compile_schema(schema) is None
+
+
+def test_addin_metaschema_not_compiled():
+    schema = {"$schema": "https://json-structure.org/meta/extended/v0/#", "$id": "dummy",
+              "name": "Extended", "type": "string"}
+    assert compile_schema(schema) is None
+    assert JSONStructureInstanceValidator(schema)._compiled is None
+
+
+def test_extended_flag_keeps_compiled_core_schema():
+    validator = JSONStructureInstanceValidator(PERSON_SCHEMA, extended=True)
+    assert validator._compiled is compile_schema(PERSON_SCHEMA)
+    assert validator.validate_instance({"name": "Ann", "age": 30}) == []
+    assert [e.code for e in validator.validate_instance({"name": "Ann", "age": 300})] == ["OUT_OF_RANGE"]
+
+
+def test_compiled_predicate_cached_by_content():
+    copy = dict(PERSON_SCHEMA)
+    assert compile_schema(copy) is compile_schema(PERSON_SCHEMA)
+
+
+def test_validator_falls_back_for_messages():
+    validator = JSONStructureInstanceValidator(PERSON_SCHEMA)
+    assert validator._compiled is not None
+    assert validator.validate_instance({"name": "Ann", "age": 30}) == []
+    errors = validator.validate_instance({"name": "Ann", "age": 300})
+    assert [e.code for e in errors] == ["OUT_OF_RANGE"]
+    assert errors[0].path == "#/age"
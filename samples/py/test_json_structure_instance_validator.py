@@ -18,15 +18,95 @@ This suite is designed to achieve 100% code coverage of the instance validator.
 
 import json
 import pytest
-import uuid
 import os
-from json_structure_instance_validator import JSONStructureInstanceValidator
+import re
+from collections.abc import Mapping
+from types import MappingProxyType
+from urllib.parse import urlparse
+from json_structure_instance_validator import (JSONStructureInstanceValidator, _compile_pattern, _flatten_composition,
+                                               _has_duplicates, _has_uri_scheme)
+
+# Fixed, well-formed UUID so the uuid tests are deterministic.
+_VALID_UUID = "550e8400-e29b-41d4-a716-446655440000"
+
+# Expected error message fragments, compiled once and shared by all tests.
+_PATTERNS = {fragment: re.compile(re.escape(fragment)) for fragment in (
+    "does not match any type in union",
+    "does not equal const",
+    "not in enum",
+    "Cannot resolve $ref",
+    "inherited via $extends",
+    "Abstract schema",
+    "conflicts with existing property",
+    "must be an absolute URI",
+    "must be a string URI",
+    "Failed to load imported schema",
+    "Unable to fetch external schema",
+    "RootType",
+    "$ref",
+    "exceeds maxLength",
+    "does not match format",
+    "does not contain required",
+    "more than maxContains",
+    "fewer than minEntries",
+    "more than maxEntries",
+    "does not match keyNames",
+    "minLength",
+)}
+
+
+def _assert_error(errors, fragment):
+    """Asserts that at least one of the errors contains the given message fragment."""
+    assert _PATTERNS[fragment].search("\n".join(errors)), f"{fragment!r} not found in {errors!r}"
+
+
+def _write_json(path, obj):
+    """Writes obj as UTF-8 JSON to path with a single unbuffered write."""
+    data = json.dumps(obj).encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+# Opt-in memoization of validation results (JSV_TEST_CACHE=1), for fast local iteration.
+_VALIDATION_CACHE = {} if os.environ.get("JSV_TEST_CACHE") == "1" else None
+
+
+def _validate(schema, instance):
+    """
+    Validates instance against a freshly constructed validator for schema.
+    When the cache is enabled, results are memoized on the JSON form of (schema, instance)
+    and a validator is built only on a miss.
+    """
+    if _VALIDATION_CACHE is None:
+        return JSONStructureInstanceValidator(schema).validate_instance(instance)
+    try:
+        key = json.dumps([schema, instance], default=dict)
+    except (TypeError, ValueError):
+        return JSONStructureInstanceValidator(schema).validate_instance(instance)
+    if key not in _VALIDATION_CACHE:
+        _VALIDATION_CACHE[key] = JSONStructureInstanceValidator(schema).validate_instance(instance)
+    return list(_VALIDATION_CACHE[key])
+
 
 # -------------------------------------------------------------------
 # Helper Schemas for $ref, $extends, and Add-ins
 # -------------------------------------------------------------------
 
-BASE_OBJECT_SCHEMA = {
+
+def _freeze(obj):
+    """Recursively wraps mappings in read-only proxies so shared schemas cannot be mutated by a test."""
+    if isinstance(obj, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return [_freeze(item) for item in obj]
+    return obj
+
+
+BASE_OBJECT_SCHEMA = _freeze({
     "$schema": "https://json-structure.org/meta/core/v0/#",
     "$id": "https://example.com/schemas/base",
     "name": "BaseObject",
@@ -34,18 +114,18 @@ BASE_OBJECT_SCHEMA = {
     "properties": {
         "baseProp": {"type": "string"}
     }
-}
+})
 
-DERIVED_SCHEMA_VALID = {
+DERIVED_SCHEMA_VALID = _freeze({
     "$schema": "https://json-structure.org/meta/core/v0/#",
     "$id": "https://example.com/schemas/derived",
     "name": "DerivedObject",
     "type": "object",
     "$extends": "#/definitions/BaseObject",
     "properties": {}  # Derived does not redefine inherited properties.
-}
+})
 
-ABSTRACT_SCHEMA = {
+ABSTRACT_SCHEMA = _freeze({
     "$schema": "https://json-structure.org/meta/core/v0/#",
     "$id": "https://example.com/schemas/abstract",
     "name": "AbstractType",
@@ -54,15 +134,15 @@ ABSTRACT_SCHEMA = {
     "properties": {
         "abstractProp": {"type": "string"}
     }
-}
+})
 
-ADDIN_SCHEMA = {
+ADDIN_SCHEMA = _freeze({
     "properties": {
         "addinProp": {"type": "number"}
     }
-}
+})
 
-ROOT_OFFERS_SCHEMA = {
+ROOT_OFFERS_SCHEMA = _freeze({
     "$schema": "https://json-structure.org/meta/core/v0/#",
     "$id": "https://example.com/schemas/root",
     "name": "RootSchema",
@@ -73,7 +153,7 @@ ROOT_OFFERS_SCHEMA = {
     "$offers": {
         "Extra": ADDIN_SCHEMA
     }
-}
+})
 
 # -------------------------------------------------------------------
 # Primitive Types Tests
@@ -83,73 +163,64 @@ ROOT_OFFERS_SCHEMA = {
 def test_string_valid():
     schema = {"type": "string", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "strSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("hello")
+    errors = _validate(schema, "hello")
     assert errors == []
 
 
 def test_string_invalid():
     schema = {"type": "string", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "strSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(123)
-    assert any("Expected string" in err for err in errors)
+    errors = _validate(schema, 123)
+    assert any(e.code == "EXPECTED_STRING" for e in errors)
 
 
 def test_number_valid():
     schema = {"type": "number", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "numSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(3.14)
+    errors = _validate(schema, 3.14)
     assert errors == []
 
 
 def test_number_invalid():
     schema = {"type": "number", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "numSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("3.14")
-    assert any("Expected number" in err for err in errors)
+    errors = _validate(schema, "3.14")
+    assert any(e.code == "EXPECTED_NUMBER" for e in errors)
 
 
 def test_boolean_valid():
     schema = {"type": "boolean", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "boolSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(True)
+    errors = _validate(schema, True)
     assert errors == []
 
 
 def test_boolean_invalid():
     schema = {"type": "boolean", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "boolSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("true")
-    assert any("Expected boolean" in err for err in errors)
+    errors = _validate(schema, "true")
+    assert any(e.code == "EXPECTED_BOOLEAN" for e in errors)
 
 
 def test_null_valid():
     schema = {"type": "null", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "nullSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(None)
+    errors = _validate(schema, None)
     assert errors == []
 
 
 def test_null_invalid():
     schema = {"type": "null", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "nullSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(0)
-    assert any("Expected null" in err for err in errors)
+    errors = _validate(schema, 0)
+    assert any(e.code == "EXPECTED_NULL" for e in errors)
 
 
 def test_any_accepts_string():
     """Test any type accepts string values"""
     schema = {"type": "any", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "anySchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("hello")
+    errors = _validate(schema, "hello")
     assert errors == []
 
 
@@ -157,8 +228,7 @@ def test_any_accepts_number():
     """Test any type accepts numeric values"""
     schema = {"type": "any", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "anySchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(42.5)
+    errors = _validate(schema, 42.5)
     assert errors == []
 
 
@@ -166,8 +236,7 @@ def test_any_accepts_object():
     """Test any type accepts object values"""
     schema = {"type": "any", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "anySchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance({"key": "value"})
+    errors = _validate(schema, {"key": "value"})
     assert errors == []
 
 
@@ -175,8 +244,7 @@ def test_any_accepts_array():
     """Test any type accepts array values"""
     schema = {"type": "any", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "anySchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance([1, 2, 3])
+    errors = _validate(schema, [1, 2, 3])
     assert errors == []
 
 
@@ -184,8 +252,7 @@ def test_any_accepts_null():
     """Test any type accepts null values"""
     schema = {"type": "any", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "anySchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(None)
+    errors = _validate(schema, None)
     assert errors == []
 
 
@@ -193,8 +260,7 @@ def test_any_accepts_boolean():
     """Test any type accepts boolean values"""
     schema = {"type": "any", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "anySchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(True)
+    errors = _validate(schema, True)
     assert errors == []
 
 
@@ -206,225 +272,197 @@ def test_any_accepts_boolean():
 def test_int8_valid():
     schema = {"type": "int8", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "int8Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(127)
+    errors = _validate(schema, 127)
     assert errors == []
 
 
 def test_int8_out_of_range():
     schema = {"type": "int8", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "int8Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(128)
-    assert any("out of range" in err for err in errors)
+    errors = _validate(schema, 128)
+    assert any(e.code == "OUT_OF_RANGE" for e in errors)
 
 
 def test_int8_negative_valid():
     schema = {"type": "int8", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "int8Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(-128)
+    errors = _validate(schema, -128)
     assert errors == []
 
 
 def test_uint8_valid():
     schema = {"type": "uint8", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uint8Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(255)
+    errors = _validate(schema, 255)
     assert errors == []
 
 
 def test_uint8_out_of_range():
     schema = {"type": "uint8", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uint8Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(256)
-    assert any("out of range" in err for err in errors)
+    errors = _validate(schema, 256)
+    assert any(e.code == "OUT_OF_RANGE" for e in errors)
 
 
 def test_uint8_negative():
     schema = {"type": "uint8", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uint8Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(-1)
-    assert any("out of range" in err for err in errors)
+    errors = _validate(schema, -1)
+    assert any(e.code == "OUT_OF_RANGE" for e in errors)
 
 
 def test_int16_valid():
     schema = {"type": "int16", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "int16Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(32767)
+    errors = _validate(schema, 32767)
     assert errors == []
 
 
 def test_int16_out_of_range():
     schema = {"type": "int16", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "int16Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(32768)
-    assert any("out of range" in err for err in errors)
+    errors = _validate(schema, 32768)
+    assert any(e.code == "OUT_OF_RANGE" for e in errors)
 
 
 def test_uint16_valid():
     schema = {"type": "uint16", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uint16Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(65535)
+    errors = _validate(schema, 65535)
     assert errors == []
 
 
 def test_uint16_out_of_range():
     schema = {"type": "uint16", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uint16Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(65536)
-    assert any("out of range" in err for err in errors)
+    errors = _validate(schema, 65536)
+    assert any(e.code == "OUT_OF_RANGE" for e in errors)
 
 
 def test_int32_valid():
     schema = {"type": "int32", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "int32Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(123)
+    errors = _validate(schema, 123)
     assert errors == []
 
 
 def test_int32_out_of_range():
     schema = {"type": "int32", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "int32Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(2**31)
-    assert any("out of range" in err for err in errors)
+    errors = _validate(schema, 2**31)
+    assert any(e.code == "OUT_OF_RANGE" for e in errors)
 
 
 def test_uint32_valid():
     schema = {"type": "uint32", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uint32Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(123)
+    errors = _validate(schema, 123)
     assert errors == []
 
 
 def test_uint32_negative():
     schema = {"type": "uint32", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uint32Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(-1)
-    assert any("out of range" in err for err in errors)
+    errors = _validate(schema, -1)
+    assert any(e.code == "OUT_OF_RANGE" for e in errors)
 
 
 def test_int64_valid():
     schema = {"type": "int64", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "int64Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("1234567890")
+    errors = _validate(schema, "1234567890")
     assert errors == []
 
 
 def test_int64_invalid_format():
     schema = {"type": "int64", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "int64Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(1234567890)
-    assert any("Expected int64 as string" in err for err in errors)
+    errors = _validate(schema, 1234567890)
+    assert any(e.code == "EXPECTED_INT64" for e in errors)
 
 
 def test_uint64_valid():
     schema = {"type": "uint64", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uint64Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("1234567890")
+    errors = _validate(schema, "1234567890")
     assert errors == []
 
 
 def test_uint64_invalid_format():
     schema = {"type": "uint64", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uint64Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(1234567890)
-    assert any("Expected uint64 as string" in err for err in errors)
+    errors = _validate(schema, 1234567890)
+    assert any(e.code == "EXPECTED_UINT64" for e in errors)
 
 
 def test_int128_valid():
     schema = {"type": "int128", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "int128Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("170141183460469231731687303715884105727")
+    errors = _validate(schema, "170141183460469231731687303715884105727")
     assert errors == []
 
 
 def test_int128_out_of_range():
     schema = {"type": "int128", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "int128Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("170141183460469231731687303715884105728")  # 2^127
-    assert any("out of range" in err for err in errors)
+    errors = _validate(schema, "170141183460469231731687303715884105728")  # 2^127
+    assert any(e.code == "OUT_OF_RANGE" for e in errors)
 
 
 def test_int128_invalid_format():
     schema = {"type": "int128", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "int128Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(12345)  # Should be string
-    assert any("Expected int128 as string" in err for err in errors)
+    errors = _validate(schema, 12345)  # Should be string
+    assert any(e.code == "EXPECTED_INT128" for e in errors)
 
 
 def test_uint128_valid():
     schema = {"type": "uint128", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uint128Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("340282366920938463463374607431768211455")  # 2^128 - 1
+    errors = _validate(schema, "340282366920938463463374607431768211455")  # 2^128 - 1
     assert errors == []
 
 
 def test_uint128_out_of_range():
     schema = {"type": "uint128", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uint128Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("340282366920938463463374607431768211456")  # 2^128
-    assert any("out of range" in err for err in errors)
+    errors = _validate(schema, "340282366920938463463374607431768211456")  # 2^128
+    assert any(e.code == "OUT_OF_RANGE" for e in errors)
 
 
 def test_uint128_negative():
     schema = {"type": "uint128", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uint128Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("-1")
-    assert any("out of range" in err for err in errors)
+    errors = _validate(schema, "-1")
+    assert any(e.code == "OUT_OF_RANGE" for e in errors)
 
 
 def test_float8_valid():
     schema = {"type": "float8", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "float8Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(0.5)
+    errors = _validate(schema, 0.5)
     assert errors == []
 
 
 def test_float8_integer_accepted():
     schema = {"type": "float8", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "float8Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(1)  # int is accepted for float8
+    errors = _validate(schema, 1)  # int is accepted for float8
     assert errors == []
 
 
 def test_float8_invalid():
     schema = {"type": "float8", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "float8Schema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("0.5")  # Should be number, not string
-    assert any("Expected float8" in err for err in errors)
+    errors = _validate(schema, "0.5")  # Should be number, not string
+    assert any(e.code == "EXPECTED_FLOAT8" for e in errors)
 
 
 def test_integer_valid():
     """Test integer type (alias for int32)"""
     schema = {"type": "integer", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "integerSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(123)
+    errors = _validate(schema, 123)
     assert errors == []
 
 
@@ -432,41 +470,36 @@ def test_integer_out_of_range():
     """Test integer type (alias for int32) range validation"""
     schema = {"type": "integer", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "integerSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(2**31)
-    assert any("out of range" in err for err in errors)
+    errors = _validate(schema, 2**31)
+    assert any(e.code == "OUT_OF_RANGE" for e in errors)
 
 
 def test_integer_invalid_type():
     """Test integer type rejects non-integers"""
     schema = {"type": "integer", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "integerSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("123")
-    assert any("Expected integer" in err for err in errors)
+    errors = _validate(schema, "123")
+    assert any(e.code == "EXPECTED_INTEGER" for e in errors)
 
 
 def test_float_valid():
     schema = {"type": "float", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "floatSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(1.23)
+    errors = _validate(schema, 1.23)
     assert errors == []
 
 
 def test_float_invalid():
     schema = {"type": "float", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "floatSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("1.23")
-    assert any("Expected float" in err for err in errors)
+    errors = _validate(schema, "1.23")
+    assert any(e.code == "EXPECTED_FLOAT" for e in errors)
 
 
 def test_double_valid():
     schema = {"type": "double", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "doubleSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(3.141592653589793)
+    errors = _validate(schema, 3.141592653589793)
     assert errors == []
 
 
@@ -474,58 +507,51 @@ def test_double_integer_accepted():
     """Test that integers are accepted for double type"""
     schema = {"type": "double", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "doubleSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(42)
+    errors = _validate(schema, 42)
     assert errors == []
 
 
 def test_double_invalid():
     schema = {"type": "double", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "doubleSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("3.14")
-    assert any("Expected double" in err for err in errors)
+    errors = _validate(schema, "3.14")
+    assert any(e.code == "EXPECTED_DOUBLE" for e in errors)
 
 
 def test_float_invalid():
     schema = {"type": "float", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "floatSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("1.23")
-    assert any("Expected float" in err for err in errors)
+    errors = _validate(schema, "1.23")
+    assert any(e.code == "EXPECTED_FLOAT" for e in errors)
 
 
 def test_decimal_valid():
     schema = {"type": "decimal", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "decimalSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("123.45")
+    errors = _validate(schema, "123.45")
     assert errors == []
 
 
 def test_decimal_invalid():
     schema = {"type": "decimal", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "decimalSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(123.45)
-    assert any("Expected decimal as string" in err for err in errors)
+    errors = _validate(schema, 123.45)
+    assert any(e.code == "EXPECTED_DECIMAL" for e in errors)
 
 
 def test_numeric_minimum_fail():
     schema = {"type": "number", "minimum": 10,
               "$schema": "https://json-structure.org/meta/extended/v0/#", "$id": "dummy", "name": "numMin",
               "$uses": ["JSONStructureValidationAddins"]}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(5)
-    assert any("less than minimum" in err for err in errors)
+    errors = _validate(schema, 5)
+    assert any(e.code == "MINIMUM" for e in errors)
 
 
 def test_numeric_minimum_pass():
     schema = {"type": "number", "minimum": 10,
               "$schema": "https://json-structure.org/meta/extended/v0/#", "$id": "dummy", "name": "numMin",
               "$uses": ["JSONStructureValidationAddins"]}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(10)
+    errors = _validate(schema, 10)
     assert errors == []
 
 
@@ -533,44 +559,39 @@ def test_numeric_maximum_fail():
     schema = {"type": "number", "maximum": 100,
               "$schema": "https://json-structure.org/meta/extended/v0/#", "$id": "dummy", "name": "numMax",
               "$uses": ["JSONStructureValidationAddins"]}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(150)
-    assert any("greater than maximum" in err for err in errors)
+    errors = _validate(schema, 150)
+    assert any(e.code == "MAXIMUM" for e in errors)
 
 
 def test_numeric_exclusiveMinimum_fail():
     schema = {"type": "number", "minimum": 10, "exclusiveMinimum": True,
               "$schema": "https://json-structure.org/meta/extended/v0/#", "$id": "dummy", "name": "numExMin",
               "$uses": ["JSONStructureValidationAddins"]}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(10)
-    assert any("not greater than exclusive minimum" in err for err in errors)
+    errors = _validate(schema, 10)
+    assert any(e.code == "EXCLUSIVE_MINIMUM" for e in errors)
 
 
 def test_numeric_exclusiveMaximum_fail():
     schema = {"type": "number", "maximum": 100, "exclusiveMaximum": True,
               "$schema": "https://json-structure.org/meta/extended/v0/#", "$id": "dummy", "name": "numExMax",
               "$uses": ["JSONStructureValidationAddins"]}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(100)
-    assert any("not less than exclusive maximum" in err for err in errors)
+    errors = _validate(schema, 100)
+    assert any(e.code == "EXCLUSIVE_MAXIMUM" for e in errors)
 
 
 def test_numeric_multipleOf_fail():
     schema = {"type": "number", "multipleOf": 5,
               "$schema": "https://json-structure.org/meta/extended/v0/#", "$id": "dummy", "name": "numMult",
               "$uses": ["JSONStructureValidationAddins"]}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(12)
-    assert any("not a multiple of" in err for err in errors)
+    errors = _validate(schema, 12)
+    assert any(e.code == "MULTIPLE_OF" for e in errors)
 
 
 def test_numeric_multipleOf_pass():
     schema = {"type": "number", "multipleOf": 5,
               "$schema": "https://json-structure.org/meta/extended/v0/#", "$id": "dummy", "name": "numMult",
               "$uses": ["JSONStructureValidationAddins"]}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(15)
+    errors = _validate(schema, 15)
     assert errors == []
 
 # -------------------------------------------------------------------
@@ -581,65 +602,57 @@ def test_numeric_multipleOf_pass():
 def test_date_valid():
     schema = {"type": "date", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "dateSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("2025-03-05")
+    errors = _validate(schema, "2025-03-05")
     assert errors == []
 
 
 def test_date_invalid():
     schema = {"type": "date", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "dateSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("03/05/2025")
-    assert any("Expected date" in err for err in errors)
+    errors = _validate(schema, "03/05/2025")
+    assert any(e.code == "EXPECTED_DATE" for e in errors)
 
 
 def test_datetime_valid():
     schema = {"type": "datetime", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "datetimeSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("2025-03-05T12:34:56Z")
+    errors = _validate(schema, "2025-03-05T12:34:56Z")
     assert errors == []
 
 
 def test_datetime_invalid():
     schema = {"type": "datetime", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "datetimeSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("2025-03-05 12:34:56")
-    assert any("Expected datetime" in err for err in errors)
+    errors = _validate(schema, "2025-03-05 12:34:56")
+    assert any(e.code == "EXPECTED_DATETIME" for e in errors)
 
 
 def test_time_valid():
     schema = {"type": "time", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "timeSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("12:34:56")
+    errors = _validate(schema, "12:34:56")
     assert errors == []
 
 
 def test_time_invalid():
     schema = {"type": "time", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "timeSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("123456")
-    assert any("Expected time" in err for err in errors)
+    errors = _validate(schema, "123456")
+    assert any(e.code == "EXPECTED_TIME" for e in errors)
 
 
 def test_duration_valid():
     schema = {"type": "duration", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "durationSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("P1Y2M3DT4H5M6S")  # ISO 8601 duration
+    errors = _validate(schema, "P1Y2M3DT4H5M6S")  # ISO 8601 duration
     assert errors == []
 
 
 def test_duration_invalid():
     schema = {"type": "duration", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "durationSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(3600)  # Should be string, not number
-    assert any("Expected duration" in err for err in errors)
+    errors = _validate(schema, 3600)  # Should be string, not number
+    assert any(e.code == "EXPECTED_DURATION" for e in errors)
 
 
 # -------------------------------------------------------------------
@@ -648,36 +661,38 @@ def test_duration_invalid():
 
 
 def test_uuid_valid():
-    valid_uuid = str(uuid.uuid4())
+    valid_uuid = _VALID_UUID
     schema = {"type": "uuid", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uuidSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(valid_uuid)
+    errors = _validate(schema, valid_uuid)
     assert errors == []
 
 
 def test_uuid_invalid():
     schema = {"type": "uuid", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uuidSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("not-a-uuid")
-    assert any("Invalid uuid format" in err for err in errors)
+    errors = _validate(schema, "not-a-uuid")
+    assert any(e.code == "INVALID_FORMAT" for e in errors)
 
 
 def test_uri_valid():
     schema = {"type": "uri", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uriSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("https://example.com")
+    errors = _validate(schema, "https://example.com")
     assert errors == []
 
 
 def test_uri_invalid():
     schema = {"type": "uri", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "uriSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("example.com")
-    assert any("Invalid uri format" in err for err in errors)
+    errors = _validate(schema, "example.com")
+    assert any(e.code == "INVALID_FORMAT" for e in errors)
+
+
+@pytest.mark.parametrize("value", ["urn:isbn:0451450523", "mailto:a@b.c", " https://example.com",
+                                   "https://example.com/a b", "https://[::1]/", "1http://x", ":x", ""])
+def test_uri_scheme_check_matches_urlparse(value):
+    assert _has_uri_scheme(value) == bool(urlparse(value).scheme)
 
 # -------------------------------------------------------------------
 # Binary and JSON Pointer Tests
@@ -687,51 +702,47 @@ def test_uri_invalid():
 def test_binary_valid():
     schema = {"type": "binary", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "binarySchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("YWJjMTIz")  # base64 for 'abc123'
+    errors = _validate(schema, "YWJjMTIz")  # base64 for 'abc123'
     assert errors == []
 
 
 def test_binary_invalid():
     schema = {"type": "binary", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "binarySchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance(12345)
-    assert any("Expected binary" in err for err in errors)
+    errors = _validate(schema, 12345)
+    assert any(e.code == "EXPECTED_BINARY" for e in errors)
 
 
 def test_jsonpointer_valid():
     schema = {"type": "jsonpointer", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "jpSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("#/a/b")
+    errors = _validate(schema, "#/a/b")
     assert errors == []
 
 
 def test_jsonpointer_invalid():
     schema = {"type": "jsonpointer", "$schema": "https://json-structure.org/meta/core/v0/#",
               "$id": "dummy", "name": "jpSchema"}
-    validator = JSONStructureInstanceValidator(schema)
-    errors = validator.validate_instance("a/b")
-    assert any("Expected JSON pointer" in err for err in errors)
+    errors = _validate(schema, "a/b")
+    assert any(e.code == "EXPECTED_JSONPOINTER" for e in errors)
 
 # -------------------------------------------------------------------
 # Compound Types Tests: object, array, set, map, tuple
 # -------------------------------------------------------------------
 
 
+# Shared base for the object tests; each test overlays only the keywords it exercises.
+_OBJECT_PROTO = _freeze({
+    "type": "object",
+    "$schema": "https://json-structure.org/meta/core/v0/#",
+    "$id": "dummy",
+    "name": "objSchema",
+    "properties": {"a": {"type": "string"}}
+})
+
+
 def test_object_valid():
-    schema = {
-        "type": "object",
-        "$schema": "https://json-structure.org/meta/core/v0/#",
-        "$id": "dummy",
-        "name": "objSchema",
-        "properties": {
-            "a": {"type": "string"},
-            "b": {"type": "number"}
-        },
-        "required": ["a"]
-    }
+    schema = {**_OBJECT_PROTO, "properties": {"a": {"type": "string"}, "b": {"type": "number"}}, "required": ["a"]}
     instance = {"a": "test", "b": 123}
     validator = JSONStructureInstanceValidator(schema)
     errors = validator.validate_instance(instance)
@@ -739,33 +750,19 @@ def test_object_valid():
 
 
 def test_object_missing_required():
-    schema = {
-        "type": "object",
-        "$schema": "https://json-structure.org/meta/core/v0/#",
-        "$id": "dummy",
-        "name": "objSchema",
-        "properties": {"a": {"type": "string"}},
-        "required": ["a"]
-    }
+    schema = {**_OBJECT_PROTO, "required": ["a"]}
     instance = {"b": "oops"}
     validator = JSONStructureInstanceValidator(schema)
     errors = validator.validate_instance(instance)
-    assert any("Missing required property" in err for err in errors)
+    assert [(e.code, e.params) for e in errors] == [("MISSING_REQUIRED", ("a",))]
 
 
 def test_object_additional_properties_false():
-    schema = {
-        "type": "object",
-        "$schema": "https://json-structure.org/meta/core/v0/#",
-        "$id": "dummy",
-        "name": "objSchema",
-        "properties": {"a": {"type": "string"}},
-        "additionalProperties": False
-    }
+    schema = {**_OBJECT_PROTO, "additionalProperties": False}
     instance = {"a": "ok", "b": "not allowed"}
     validator = JSONStructureInstanceValidator(schema)
     errors = validator.validate_instance(instance)
-    assert any("Additional property 'b'" in err for err in errors)
+    assert [(e.code, e.params) for e in errors] == [("ADDITIONAL_PROPERTY", ("b",))]
 
 
 def test_array_valid():
@@ -793,7 +790,24 @@ def test_array_invalid():
     instance = [1, "two", 3]
     validator = JSONStructureInstanceValidator(schema)
     errors = validator.validate_instance(instance)
-    assert any("Expected number" in err for err in errors)
+    assert errors and "Expected number" in errors[0]
+
+
+@pytest.mark.parametrize("bad_index", [0, 1, 9999])
+def test_array_large_invalid_fails_fast(bad_index):
+    """Only the first error of a large array is asserted, so the validator may stop early."""
+    schema = {
+        "type": "array",
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "dummy",
+        "name": "arraySchema",
+        "items": {"type": "number"}
+    }
+    instance = list(range(10000))
+    instance[bad_index] = "bad"
+    validator = JSONStructureInstanceValidator(schema)
+    errors = validator.validate_instance(instance)
+    assert errors and f"Expected number at #[{bad_index}]" in errors[0]
 
 
 def test_set_valid():
@@ -821,7 +835,22 @@ def test_set_duplicate():
     instance = ["a", "b", "a"]
     validator = JSONStructureInstanceValidator(schema)
     errors = validator.validate_instance(instance)
-    assert any("duplicate items" in err for err in errors)
+    assert errors and "duplicate items" in errors[0]
+
+
+@pytest.mark.parametrize("items,expected", [
+    (["a", "b", "c"], False),
+    (["a", "b", "a"], True),
+    ([1, 2, 1], True),
+    ([1, True, "1", None], False),
+    ([True, True], True),
+    ([1, 1.0], False),
+    ([0.0, -0.0], False),
+    ([{"a": 1, "b": 2}, {"b": 2, "a": 1}], True),
+    ([[1, 2], [2, 1]], False),
+])
+def test_has_duplicates_matches_json_equality(items, expected):
+    assert _has_duplicates(items) is expected
 
 
 def test_map_valid():
@@ -871,7 +900,7 @@ def test_tuple_wrong_length():
     instance = ["only one"]
     validator = JSONStructureInstanceValidator(schema)
     errors = validator.validate_instance(instance)
-    assert any("does not equal expected" in err for err in errors)
+    assert errors and "does not equal expected" in errors[0]
 
 # -------------------------------------------------------------------
 # Union Type Tests
@@ -899,7 +928,7 @@ def test_union_invalid():
     }
     validator = JSONStructureInstanceValidator(schema)
     errors = validator.validate_instance(True)
-    assert any("does not match any type in union" in err for err in errors)
+    _assert_error(errors, "does not match any type in union")
 
 # -------------------------------------------------------------------
 # const and enum Tests
@@ -919,7 +948,7 @@ def test_const_invalid():
               "$schema": "https://json-structure.org/meta/core/v0/#", "$id": "dummy", "name": "constSchema"}
     validator = JSONStructureInstanceValidator(schema)
     errors = validator.validate_instance(2.71)
-    assert any("does not equal const" in err for err in errors)
+    _assert_error(errors, "does not equal const")
 
 
 def test_enum_valid():
@@ -935,7 +964,75 @@ def test_enum_invalid():
         "a", "b", "c"], "$schema": "https://json-structure.org/meta/core/v0/#", "$id": "dummy", "name": "enumSchema"}
     validator = JSONStructureInstanceValidator(schema)
     errors = validator.validate_instance("d")
-    assert any("not in enum" in err for err in errors)
+    _assert_error(errors, "not in enum")
+
+
+def test_enum_uses_precomputed_plan():
+    schema = {
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "dummy",
+        "name": "enumPlan",
+        "type": "object",
+        "properties": {
+            "color": {"type": "string", "enum": ["red", "green"]},
+            "shape": {"type": "any", "enum": [[1, 2], {"kind": "circle"}]}
+        }
+    }
+    validator = JSONStructureInstanceValidator(schema)
+    color = schema["properties"]["color"]
+    assert validator._plan_for(color).enum_set == frozenset(["red", "green"])
+    # Enums with unhashable members are not planned and fall back to a list scan.
+    assert validator._plan_for(schema["properties"]["shape"]).enum_set is None
+    # Schemas that are not part of the root schema have no plan.
+    assert validator._plan_for(dict(color)) is None
+    assert validator.validate_instance({"color": "green", "shape": {"kind": "circle"}}) == []
+    errors = validator.validate_instance({"color": "blue", "shape": [2, 1]})
+    assert [e.code for e in errors] == ["ENUM_MISMATCH", "ENUM_MISMATCH"]
+
+
+def test_required_reported_in_declared_order():
+    schema = {
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "dummy",
+        "name": "requiredPlan",
+        "type": "object",
+        "properties": {
+            "a": {"type": "string"},
+            "b": {"type": "string"},
+            "c": {"type": "string"}
+        },
+        "required": ["c", "a", "b"]
+    }
+    validator = JSONStructureInstanceValidator(schema)
+    assert validator._plan_for(validator.root_schema).required_set == frozenset(["a", "b", "c"])
+    assert validator.validate_instance({"a": "x", "b": "y", "c": "z"}) == []
+    errors = validator.validate_instance({"a": "x"})
+    assert [(e.code, e.params) for e in errors] == [("MISSING_REQUIRED", ("c",)), ("MISSING_REQUIRED", ("b",))]
+
+
+def test_dependent_required_uses_precomputed_table():
+    schema = {
+        "$schema": "https://json-structure.org/meta/extended/v0/#",
+        "$id": "dummy",
+        "name": "dependentPlan",
+        "$uses": ["JSONStructureValidation"],
+        "type": "object",
+        "properties": {
+            "card": {"type": "string"},
+            "billing": {"type": "string"},
+            "cvv": {"type": "string"}
+        },
+        "dependentRequired": {"card": ["cvv", "billing"]}
+    }
+    validator = JSONStructureInstanceValidator(schema)
+    assert validator._plan_for(validator.root_schema).dependent_required == (
+        ("card", ("cvv", "billing"), frozenset(["cvv", "billing"])),)
+    assert validator.validate_instance({"card": "x", "billing": "y", "cvv": "z"}) == []
+    assert validator.validate_instance({"billing": "y"}) == []
+    errors = validator.validate_instance({"card": "x"})
+    assert {e.code for e in errors} == {"DEPENDENT_REQUIRED"}
+    assert [e.params for e in errors[:2]] == [("card", "cvv"), ("card", "billing")]
+    assert errors[0] == "Property 'card' at # requires dependent property 'cvv'"
 
 # -------------------------------------------------------------------
 # $ref Resolution Tests (using definitions)
@@ -973,7 +1070,63 @@ def test_ref_resolution_invalid():
     }
     validator = JSONStructureInstanceValidator(schema)
     errors = validator.validate_instance({"value": "test"})
-    assert any("Cannot resolve $ref" in err for err in errors)
+    _assert_error(errors, "Cannot resolve $ref")
+
+
+def test_ref_resolution_invalid_strict():
+    schema = {
+        "type": "object",
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "dummy",
+        "name": "refSchema",
+        "properties": {
+            "value": {"type": {"$ref": "#/definitions/NonExistent"}}
+        },
+        "definitions": {}
+    }
+    with pytest.raises(JSONStructureInstanceValidator.ResolutionError,
+                       match=r"Cannot resolve \$ref.*NonExistent"):
+        JSONStructureInstanceValidator(schema, strict_refs=True)
+
+
+def test_ref_resolution_valid_strict():
+    schema = {
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "dummy",
+        "name": "refSchema",
+        "type": "object",
+        "properties": {
+            "value": {"type": {"$ref": "#/definitions/RefType"}}
+        },
+        "definitions": {
+            "RefType": {"name": "RefType", "type": "string"}
+        }
+    }
+    validator = JSONStructureInstanceValidator(schema, strict_refs=True)
+    assert validator.validate_instance({"value": "test"}) == []
+
+
+def test_ref_resolution_is_memoized():
+    schema = {
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "dummy",
+        "name": "refSchema",
+        "type": "object",
+        "properties": {
+            "a": {"type": {"$ref": "#/definitions/RefType"}},
+            "b": {"type": {"$ref": "#/definitions/RefType"}}
+        },
+        "definitions": {
+            "RefType": {"name": "RefType", "type": "string"}
+        }
+    }
+    validator = JSONStructureInstanceValidator(schema)
+    # Pointers are resolved when the validator is built, not on first use.
+    assert validator._ref_cache == {"#/definitions/RefType": schema["definitions"]["RefType"]}
+    assert validator.validate_instance({"a": "x", "b": "y"}) == []
+    assert validator._ref_cache == {"#/definitions/RefType": schema["definitions"]["RefType"]}
+    assert validator._resolve_ref("#/definitions/Missing") is None
+    assert "#/definitions/Missing" not in validator._ref_cache
 
 # -------------------------------------------------------------------
 # $extends Tests
@@ -1015,7 +1168,7 @@ def test_extends_conflict():
     instance = {"child": {"baseProp": "should be string"}}
     validator = JSONStructureInstanceValidator(root_schema)
     errors = validator.validate_instance(instance)
-    assert any("inherited via $extends" in err for err in errors)
+    _assert_error(errors, "inherited via $extends")
 
 # -------------------------------------------------------------------
 # Abstract Schema Test
@@ -1027,7 +1180,7 @@ def test_abstract_schema_usage():
     instance = {"abstractProp": "hello"}
     validator = JSONStructureInstanceValidator(schema)
     errors = validator.validate_instance(instance)
-    assert any("Abstract schema" in err for err in errors)
+    _assert_error(errors, "Abstract schema")
 
 # -------------------------------------------------------------------
 # $offers/$uses (Add-In Types) Tests
@@ -1056,7 +1209,7 @@ def test_uses_addin_conflict():
     instance = {"main": "hello", "$uses": ["Extra"], "extra": 123}
     validator = JSONStructureInstanceValidator(schema)
     errors = validator.validate_instance(instance)
-    assert any("conflicts with existing property" in err for err in errors)
+    _assert_error(errors, "conflicts with existing property")
 
 # -------------------------------------------------------------------
 # JSONStructureImport Extension Tests ($import and $importdefs)
@@ -1082,10 +1235,10 @@ def test_import_and_importdefs(tmp_path):
             "LibraryType": {"name": "LibraryType", "type": "string"}
         }
     }
-    person_file = tmp_path / "people.json"
-    person_file.write_text(json.dumps(external_person), encoding="utf-8")
-    importdefs_file = tmp_path / "importdefs.json"
-    importdefs_file.write_text(json.dumps(external_importdefs), encoding="utf-8")
+    person_path = os.fspath(tmp_path / "people.json")
+    _write_json(person_path, external_person)
+    importdefs_path = os.fspath(tmp_path / "importdefs.json")
+    _write_json(importdefs_path, external_importdefs)
 
     local_schema = {
         "$schema": "https://json-structure.org/meta/core/v0/#",
@@ -1100,8 +1253,8 @@ def test_import_and_importdefs(tmp_path):
         "$importdefs": "https://example.com/importdefs.json"
     }
     import_map = {
-        "https://example.com/people.json": str(person_file),
-        "https://example.com/importdefs.json": str(importdefs_file)
+        "https://example.com/people.json": person_path,
+        "https://example.com/importdefs.json": importdefs_path
     }
     instance = {
         "person": {"firstName": "Alice", "lastName": "Smith"},
@@ -1155,7 +1308,7 @@ def test_import_invalid_uri_format():
     instance = {"imported1": "value1", "imported2": "value2"}
     validator = JSONStructureInstanceValidator(schema, allow_import=True)
     # Check errors from import processing during construction
-    assert any("must be an absolute URI" in err for err in validator.errors)
+    _assert_error(validator.errors, "must be an absolute URI")
 
 
 def test_import_non_string_uri():
@@ -1181,7 +1334,7 @@ def test_import_non_string_uri():
     instance = {"imported1": "value1", "imported2": "value2"}
     validator = JSONStructureInstanceValidator(schema, allow_import=True)
     # Check errors from import processing during construction
-    assert any("must be a string URI" in err for err in validator.errors)
+    _assert_error(validator.errors, "must be a string URI")
 
 
 def test_import_missing_file():
@@ -1202,7 +1355,10 @@ def test_import_missing_file():
     instance = {"imported": "value"}
     validator = JSONStructureInstanceValidator(schema, allow_import=True, import_map=import_map)
     # Check errors from import processing during construction
-    assert any("Failed to load imported schema" in err for err in validator.errors)
+    _assert_error(validator.errors, "Failed to load imported schema")
+    # and report them with every validated instance.
+    for _ in range(2):
+        _assert_error(validator.validate_instance(instance), "Failed to load imported schema")
 
 
 def test_import_network_failure():
@@ -1220,7 +1376,7 @@ def test_import_network_failure():
     instance = {"imported": "value"}
     validator = JSONStructureInstanceValidator(schema, allow_import=True)
     # Check errors from import processing during construction
-    assert any("Unable to fetch external schema" in err for err in validator.errors)
+    _assert_error(validator.errors, "Unable to fetch external schema")
 
 
 def test_import_malformed_json(tmp_path):
@@ -1244,7 +1400,7 @@ def test_import_malformed_json(tmp_path):
     instance = {"imported": "value"}
     validator = JSONStructureInstanceValidator(schema, allow_import=True, import_map=import_map)
     # Check errors from import processing during construction
-    assert any("Failed to load imported schema" in err for err in validator.errors)
+    _assert_error(validator.errors, "Failed to load imported schema")
 
 
 def test_import_shadowing(tmp_path):
@@ -1265,7 +1421,7 @@ def test_import_shadowing(tmp_path):
         }
     }
     external_file = tmp_path / "external.json"
-    external_file.write_text(json.dumps(external_schema), encoding="utf-8")
+    _write_json(external_file, external_schema)
 
     # Local schema that imports and then shadows the Person type
     local_schema = {
@@ -1362,11 +1518,11 @@ def test_nested_imports(tmp_path):
     
     # Write all schemas to files
     base_file = tmp_path / "base.json"
-    base_file.write_text(json.dumps(base_schema), encoding="utf-8")
+    _write_json(base_file, base_schema)
     intermediate_file = tmp_path / "intermediate.json"
-    intermediate_file.write_text(json.dumps(intermediate_schema), encoding="utf-8")
+    _write_json(intermediate_file, intermediate_schema)
     top_file = tmp_path / "top.json"
-    top_file.write_text(json.dumps(top_schema), encoding="utf-8")
+    _write_json(top_file, top_schema)
     
     import_map = {
         "https://example.com/base.json": str(base_file),
@@ -1413,7 +1569,7 @@ def test_import_into_namespace(tmp_path):
         }
     }
     external_file = tmp_path / "external.json"
-    external_file.write_text(json.dumps(external_schema), encoding="utf-8")
+    _write_json(external_file, external_schema)
 
     local_schema = {
         "$schema": "https://json-structure.org/meta/core/v0/#",
@@ -1466,7 +1622,7 @@ def test_import_root_level_vs_definitions_level(tmp_path):
         }
     }
     external_file = tmp_path / "external.json"
-    external_file.write_text(json.dumps(external_schema), encoding="utf-8")
+    _write_json(external_file, external_schema)
 
     # Root-level import brings everything into root namespace
     root_import_schema = {
@@ -1536,7 +1692,7 @@ def test_importdefs_only_imports_definitions(tmp_path):
         }
     }
     external_file = tmp_path / "external.json"
-    external_file.write_text(json.dumps(external_schema), encoding="utf-8")
+    _write_json(external_file, external_schema)
 
     schema = {
         "$schema": "https://json-structure.org/meta/core/v0/#",
@@ -1563,7 +1719,7 @@ def test_importdefs_only_imports_definitions(tmp_path):
     validator = JSONStructureInstanceValidator(schema, allow_import=True, import_map=import_map)
     errors = validator.validate_instance(instance)
     # Should have errors because RootType is not available via $importdefs
-    assert any("RootType" in err for err in errors)
+    _assert_error(errors, "RootType")
 
 
 def test_import_empty_definitions():
@@ -1583,7 +1739,7 @@ def test_import_empty_definitions():
     validator = JSONStructureInstanceValidator(schema, allow_import=True)
     errors = validator.validate_instance(instance)
     # Should fail because no definitions were imported
-    assert any("$ref" in err for err in errors)
+    _assert_error(errors, "$ref")
 
 
 def test_import_with_complex_nested_structure(tmp_path):
@@ -1646,7 +1802,7 @@ def test_import_with_complex_nested_structure(tmp_path):
         }
     }
     complex_file = tmp_path / "complex.json"
-    complex_file.write_text(json.dumps(complex_external), encoding="utf-8")
+    _write_json(complex_file, complex_external)
 
     local_schema = {
         "$schema": "https://json-structure.org/meta/core/v0/#",
@@ -1948,151 +2104,134 @@ def test_precision_and_scale_numeric():
 # Missing Validation Keyword Tests
 # -------------------------------------------------------------------
 
-def test_string_maxLength():
+@pytest.fixture
+def make_validator():
+    """
+    Returns a factory for validators of extended-metaschema schemas that use the
+    validation addins; keywords become the schema's type and constraint keywords.
+    """
+    def _make(name, **keywords):
+        return JSONStructureInstanceValidator({
+            "$schema": "https://json-structure.org/meta/extended/v0/#",
+            "$id": "dummy",
+            "name": name,
+            "$uses": ["JSONStructureValidationAddins"],
+            **keywords
+        })
+    return _make
+
+
+def test_string_maxLength(make_validator):
     """Test maxLength validation keyword for strings"""
-    schema = {
-        "$schema": "https://json-structure.org/meta/extended/v0/#",
-        "$id": "dummy",
-        "name": "StringWithMaxLength",
-        "$uses": ["JSONStructureValidationAddins"],
-        "type": "string",
-        "maxLength": 10
-    }
     # Valid case
-    validator = JSONStructureInstanceValidator(schema)
+    validator = make_validator("StringWithMaxLength", type="string", maxLength=10)
     errors = validator.validate_instance("hello")
     assert errors == []
       # Invalid case - string too long
     errors = validator.validate_instance("this string is too long")
-    assert any("exceeds maxLength" in err for err in errors)
+    _assert_error(errors, "exceeds maxLength")
 
 
-def test_string_format_validation():
+def test_string_format_validation(make_validator):
     """Test format validation keyword for various string formats"""
     # Email format
-    email_schema = {
-        "$schema": "https://json-structure.org/meta/extended/v0/#",
-        "$id": "dummy",
-        "name": "EmailFormat",
-        "$uses": ["JSONStructureValidationAddins"],
-        "type": "string",
-        "format": "email"
-    }
-    validator = JSONStructureInstanceValidator(email_schema)
+    validator = make_validator(
+        "EmailFormat",
+        type="string",
+        format="email"
+    )
     
     # Valid email
     errors = validator.validate_instance("user@example.com")
     assert errors == []
       # Invalid email
     errors = validator.validate_instance("invalid-email")
-    assert any("does not match format" in err for err in errors)
+    _assert_error(errors, "does not match format")
     
     # IPv4 format
-    ipv4_schema = {
-        "$schema": "https://json-structure.org/meta/extended/v0/#",
-        "$id": "dummy",
-        "name": "IPv4Format",
-        "$uses": ["JSONStructureValidationAddins"],
-        "type": "string",
-        "format": "ipv4"
-    }
-    validator = JSONStructureInstanceValidator(ipv4_schema)
+    validator = make_validator(
+        "IPv4Format",
+        type="string",
+        format="ipv4"
+    )
     
     # Valid IPv4
     errors = validator.validate_instance("192.168.1.1")
     assert errors == []
       # Invalid IPv4
     errors = validator.validate_instance("999.999.999.999")
-    assert any("does not match format" in err for err in errors)
+    _assert_error(errors, "does not match format")
 
 
-def test_array_contains_validation():
+def test_array_contains_validation(make_validator):
     """Test contains, minContains, maxContains for arrays"""
-    schema = {
-        "$schema": "https://json-structure.org/meta/extended/v0/#",
-        "$id": "dummy",
-        "name": "ArrayContains",
-        "$uses": ["JSONStructureValidationAddins"],
-        "type": "array",
-        "items": {"type": "string"},
-        "contains": {"type": "string", "const": "required"},
-        "minContains": 1,
-        "maxContains": 3
-    }
-    validator = JSONStructureInstanceValidator(schema)
+    validator = make_validator(
+        "ArrayContains",
+        type="array",
+        items={"type": "string"},
+        contains={"type": "string", "const": "required"},
+        minContains=1,
+        maxContains=3
+    )
     
     # Valid case - contains required element
     errors = validator.validate_instance(["optional", "required", "other"])
     assert errors == []
       # Invalid case - missing required element
     errors = validator.validate_instance(["optional", "other"])
-    assert any("does not contain required" in err for err in errors)
+    _assert_error(errors, "does not contain required")
       # Invalid case - too many required elements
     errors = validator.validate_instance(["required", "required", "required", "required"])
-    assert any("more than maxContains" in err for err in errors)
+    _assert_error(errors, "more than maxContains")
 
 
-def test_map_validation_keywords():
+def test_map_validation_keywords(make_validator):
     """Test map-specific validation keywords (minEntries, maxEntries, patternKeys, keyNames)"""
     # Test minEntries and maxEntries
-    entries_schema = {
-        "$schema": "https://json-structure.org/meta/extended/v0/#",
-        "$id": "dummy",
-        "name": "MapEntries",
-        "$uses": ["JSONStructureValidationAddins"],
-        "type": "map",
-        "values": {"type": "string"},
-        "minEntries": 2,
-        "maxEntries": 5
-    }
-    validator = JSONStructureInstanceValidator(entries_schema)
+    validator = make_validator(
+        "MapEntries",
+        type="map",
+        values={"type": "string"},
+        minEntries=2,
+        maxEntries=5
+    )
     
     # Valid case
     errors = validator.validate_instance({"key1": "value1", "key2": "value2"})
     assert errors == []
       # Invalid case - too few entries
     errors = validator.validate_instance({"key1": "value1"})
-    assert any("fewer than minEntries" in err for err in errors)
+    _assert_error(errors, "fewer than minEntries")
       # Invalid case - too many entries
     map_data = {f"key{i}": f"value{i}" for i in range(1, 7)}
     errors = validator.validate_instance(map_data)
-    assert any("more than maxEntries" in err for err in errors)
+    _assert_error(errors, "more than maxEntries")
     
     # Test patternKeys
-    pattern_schema = {
-        "$schema": "https://json-structure.org/meta/extended/v0/#",
-        "$id": "dummy",
-        "name": "MapPatternKeys",
-        "$uses": ["JSONStructureValidationAddins"],
-        "type": "map",
-        "values": {"type": "string"},
-        "patternKeys": {
-            "^prefix_": {"type": "string"}
-        }
-    }
-    validator = JSONStructureInstanceValidator(pattern_schema)
+    validator = make_validator(
+        "MapPatternKeys",
+        type="map",
+        values={"type": "string"},
+        patternKeys={"^prefix_": {"type": "string"}}
+    )
     
     # Valid case
     errors = validator.validate_instance({"prefix_key": "value"})
     assert errors == []
     
     # Test keyNames
-    keynames_schema = {
-        "$schema": "https://json-structure.org/meta/extended/v0/#",
-        "$id": "dummy",
-        "name": "MapKeyNames",
-        "$uses": ["JSONStructureValidationAddins"],
-        "type": "map",
-        "values": {"type": "string"},
-        "keyNames": {"type": "string", "pattern": "^[a-z]+$"}
-    }
-    validator = JSONStructureInstanceValidator(keynames_schema)
+    validator = make_validator(
+        "MapKeyNames",
+        type="map",
+        values={"type": "string"},
+        keyNames={"type": "string", "pattern": "^[a-z]+$"}
+    )
     
     # Valid case
     errors = validator.validate_instance({"lowercase": "value"})
     assert errors == []    # Invalid case
     errors = validator.validate_instance({"UPPERCASE": "value"})
-    assert any("does not match keyNames" in err for err in errors)
+    _assert_error(errors, "does not match keyNames")
 
 
 # -------------------------------------------------------------------
@@ -2304,6 +2443,50 @@ def test_malformed_validation_keywords():
     assert any("Invalid minLength constraint" in err or "Invalid pattern constraint" in err for err in errors)
 
 
+def test_pattern_compiled_once():
+    """Schema patterns are compiled once and reused across validations"""
+    schema = {
+        "$schema": "https://json-structure.org/meta/extended/v0/#",
+        "$id": "dummy",
+        "name": "PatternReuse",
+        "$uses": ["JSONStructureValidation"],
+        "type": "string",
+        "pattern": "^[a-z]+-reuse$"
+    }
+    validator = JSONStructureInstanceValidator(schema)
+    assert validator.validate_instance("abc-reuse") == []
+    misses = _compile_pattern.cache_info().misses
+    assert validator.validate_instance("def-reuse") == []
+    assert [e.code for e in validator.validate_instance("Def-reuse")] == ["PATTERN"]
+    assert _compile_pattern.cache_info().misses == misses
+    assert _compile_pattern("^[a-z]+-reuse$") is _compile_pattern("^[a-z]+-reuse$")
+
+
+@pytest.mark.parametrize("schema_extra,instance,codes", [
+    ({"type": "int32", "minimum": 0, "maximum": 10, "multipleOf": 2}, 4, []),
+    ({"type": "int32", "minimum": 0, "maximum": 10, "multipleOf": 2}, 5, ["MULTIPLE_OF"]),
+    ({"type": "int32", "minimum": 0, "maximum": 10, "multipleOf": 2}, 12, ["MAXIMUM"]),
+    ({"type": "double", "minimum": 1.5, "exclusiveMinimum": True}, 1.5, ["EXCLUSIVE_MINIMUM"]),
+    ({"type": "double", "maximum": 2, "exclusiveMaximum": True}, 1.999, []),
+    ({"type": "double", "multipleOf": 0.1}, float("inf"), ["INVALID_CONSTRAINT"]),
+    ({"type": "string", "minLength": 2, "maxLength": 4, "pattern": "^a"}, "abc", []),
+    ({"type": "string", "minLength": 2, "maxLength": 4, "pattern": "^a"}, "abcde", ["MAX_LENGTH"]),
+    ({"type": "string", "minLength": 2, "maxLength": 4, "pattern": "^a"}, "bc", ["PATTERN"]),
+])
+def test_value_check_matches_keyword_checks(schema_extra, instance, codes):
+    """The precomputed value predicate only short-circuits instances the keyword checks accept"""
+    schema = {
+        "$schema": "https://json-structure.org/meta/extended/v0/#",
+        "$id": "dummy",
+        "name": "ValueCheck",
+        "$uses": ["JSONStructureValidation"],
+        **schema_extra
+    }
+    validator = JSONStructureInstanceValidator(schema)
+    assert validator._plan_for(validator.root_schema).value_check is not None
+    assert [e.code for e in validator.validate_instance(instance)] == codes
+
+
 def test_uses_with_unknown_extension():
     """Test $uses with unknown/unsupported extensions"""
     schema = {
@@ -2383,7 +2566,121 @@ def test_conditional_composition_nested():
     errors = validator.validate_instance("hello")
     assert errors == []    # Invalid case
     errors = validator.validate_instance("hi")  # Too short
-    assert any("minLength" in err for err in errors)
+    _assert_error(errors, "minLength")
+
+
+def _composition_schema(**keywords):
+    return {
+        "$schema": "https://json-structure.org/meta/extended/v0/#",
+        "$id": "dummy",
+        "name": "Composition",
+        "$uses": ["JSONStructureConditionalComposition", "JSONStructureValidation"],
+        **keywords
+    }
+
+
+def test_any_of_failure_lists_every_branch():
+    schema = _composition_schema(anyOf=[{"type": "string"}, {"type": "boolean"}])
+    validator = JSONStructureInstanceValidator(schema)
+    assert JSONStructureInstanceValidator(schema).validate_instance("ok") == []
+    errors = validator.validate_instance(42)
+    mismatch = [e for e in errors if e.code == "ANY_OF_MISMATCH"]
+    assert mismatch and "anyOf[0]" in mismatch[0] and "anyOf[1]" in mismatch[0]
+
+
+def test_one_of_reports_exact_match_count():
+    schema = _composition_schema(oneOf=[{"type": "number"}, {"type": "number"}, {"type": "number"}])
+    errors = JSONStructureInstanceValidator(schema).validate_instance(1)
+    assert any(e.code == "ONE_OF_MISMATCH" and "matched 3" in e for e in errors)
+    schema = _composition_schema(oneOf=[{"type": "string"}, {"type": "number"}])
+    assert JSONStructureInstanceValidator(schema).validate_instance(1) == []
+
+
+def test_nested_union_inside_not_and_if():
+    """Probing a subschema must not be cut short by errors the subschema itself tolerates"""
+    schema = _composition_schema(
+        **{"not": {"type": ["string", "boolean"]},
+           "if": {"type": ["boolean", "number"]},
+           "then": {"type": "number"}}
+    )
+    assert JSONStructureInstanceValidator(schema).validate_instance(12) == []
+    errors = JSONStructureInstanceValidator(schema).validate_instance("text")
+    assert any(e.code == "NOT_MATCHED" for e in errors)
+    errors = JSONStructureInstanceValidator(schema).validate_instance(True)
+    assert any(e.code == "NOT_MATCHED" for e in errors)
+    assert any(e.code == "EXPECTED_NUMBER" and e.path == "#/then" for e in errors)
+
+
+def test_union_match_keeps_earlier_errors():
+    schema = {
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "dummy",
+        "name": "unionObject",
+        "type": "object",
+        "properties": {
+            "a": {"type": "string"},
+            "b": {"type": ["string", "number"]}
+        }
+    }
+    errors = JSONStructureInstanceValidator(schema).validate_instance({"a": 1, "b": 2})
+    assert [e.code for e in errors] == ["EXPECTED_STRING"]
+
+
+def test_flatten_composition():
+    """Nested single-keyword allOf/anyOf subschemas are hoisted into their parent"""
+    a, b, c = {"type": "string"}, {"type": "number"}, {"type": "boolean"}
+    assert _flatten_composition([{"allOf": [a, b]}, c], "allOf") == [a, b, c]
+    assert _flatten_composition([{"allOf": [{"allOf": [a]}]}], "allOf") == [a]
+    assert _flatten_composition([{"anyOf": [a, b]}, c], "anyOf") == [a, b, c]
+    # Subschemas carrying other keywords, or a different keyword, are left alone.
+    mixed = {"allOf": [a], "type": "string"}
+    assert _flatten_composition([mixed, {"anyOf": [b]}], "allOf") == [mixed, {"anyOf": [b]}]
+
+
+def test_all_of_object_schemas_merged():
+    """allOf over plain object schemas is checked through one merged schema, with per-subschema errors"""
+    schema = {
+        "$schema": "https://json-structure.org/meta/extended/v0/#",
+        "$id": "dummy",
+        "name": "MergedAllOf",
+        "$uses": ["JSONStructureConditionalComposition"],
+        "allOf": [
+            {"type": "object", "properties": {"name": {"type": "string"}}, "required": ["name"]},
+            {"allOf": [{"type": "object", "properties": {"age": {"type": "int32"}}, "required": ["age", "name"]}]}
+        ]
+    }
+    validator = JSONStructureInstanceValidator(schema)
+    merged = validator._plan_for(validator.root_schema).all_of_merged
+    assert merged["required"] == ["name", "age"]
+    assert set(merged["properties"]) == {"name", "age"}
+    assert validator.validate_instance({"name": "Ann", "age": 30}) == []
+    errors = validator.validate_instance({"name": "Ann", "age": "30"})
+    assert {e.path for e in errors} == {"#/allOf[1]/age"}
+    # Conflicting property schemas are left to the per-subschema checks.
+    schema["allOf"][1]["allOf"][0]["properties"]["name"] = {"type": "int32"}
+    validator = JSONStructureInstanceValidator(schema)
+    assert validator._plan_for(validator.root_schema).all_of_merged is None
+
+
+@pytest.mark.parametrize("keyword", ["allOf", "anyOf"])
+def test_nested_composition_matches_flat(keyword):
+    """Nested and flat allOf/anyOf schemas accept and reject the same instances"""
+    def make_schema(subschemas):
+        return {
+            "$schema": "https://json-structure.org/meta/extended/v0/#",
+            "$id": "dummy",
+            "name": "Composition",
+            "$uses": ["JSONStructureConditionalComposition", "JSONStructureValidation"],
+            keyword: subschemas
+        }
+    first = {"type": "string", "minLength": 2}
+    second = {"type": "string", "maxLength": 4}
+    nested = make_schema([{keyword: [{keyword: [first]}, second]}])
+    flat = make_schema([first, second])
+    for instance in ["abc", "a", "abcdef", 42]:
+        nested_errors = JSONStructureInstanceValidator(nested).validate_instance(instance)
+        flat_errors = JSONStructureInstanceValidator(flat).validate_instance(instance)
+        assert bool(nested_errors) == bool(flat_errors)
 
 
 def test_validation_with_default_values():
@@ -2691,7 +2988,7 @@ def test_import_ref_rewriting_in_definitions(tmp_path):
         }
     }
     external_file = tmp_path / "people.json"
-    external_file.write_text(json.dumps(external_schema), encoding="utf-8")
+    _write_json(external_file, external_schema)
 
     # Local schema imports people.json into a namespace
     local_schema = {
@@ -2764,7 +3061,7 @@ def test_import_ref_rewriting_extends(tmp_path):
         }
     }
     external_file = tmp_path / "types.json"
-    external_file.write_text(json.dumps(external_schema), encoding="utf-8")
+    _write_json(external_file, external_schema)
 
     local_schema = {
         "$schema": "https://json-structure.org/meta/core/v0/#",
@@ -2833,7 +3130,7 @@ def test_import_deep_nested_refs(tmp_path):
         }
     }
     external_file = tmp_path / "nested.json"
-    external_file.write_text(json.dumps(external_schema), encoding="utf-8")
+    _write_json(external_file, external_schema)
 
     local_schema = {
         "$schema": "https://json-structure.org/meta/core/v0/#",
@@ -2867,6 +3164,113 @@ def test_import_deep_nested_refs(tmp_path):
     assert errors == [], f"Expected no errors but got: {errors}"
 
 
+# -------------------------------------------------------------------
+# Read-only Schema Tests
+# -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("schema,instance,codes", [
+    (_freeze({"$schema": "https://json-structure.org/meta/validation/v0/#", "$id": "dummy", "name": "Frozen",
+              "type": "object", "properties": {"a": {"type": "string", "maxLength": 2}}}),
+     {"$uses": ["JSONStructureValidation"], "a": "abc"}, ["MAX_LENGTH"]),
+    (_freeze({"$schema": "https://json-structure.org/meta/extended/v0/#", "$id": "dummy", "name": "Frozen",
+              "$uses": ["JSONStructureConditionalComposition"], "type": "string",
+              "allOf": [{"type": "string", "maxLength": 2, "$uses": ["JSONStructureValidation"]}]}),
+     "abc", ["MAX_LENGTH"]),
+])
+def test_frozen_schema_left_unmodified(schema, instance, codes):
+    """Addins enabled by the metaschema or the instance are never added to the caller's schema"""
+    before = json.dumps(schema, default=dict)
+    errors = JSONStructureInstanceValidator(schema).validate_instance(instance)
+    assert {e.code for e in errors} == set(codes)
+    assert json.dumps(schema, default=dict) == before
+
+
+def test_frozen_schema_with_import(tmp_path):
+    """$import inside a read-only schema is resolved without modifying the schema"""
+    external_path = os.fspath(tmp_path / "people.json")
+    _write_json(external_path, {
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "https://example.com/people.json",
+        "definitions": {"Person": {"name": "Person", "type": "object",
+                                   "properties": {"firstName": {"type": "string"}}}}
+    })
+    schema = _freeze({
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "https://example.com/schema/local",
+        "name": "LocalSchema",
+        "type": "object",
+        "properties": {"person": {"type": {"$ref": "#/Person"}}},
+        "$import": "https://example.com/people.json"
+    })
+    validator = JSONStructureInstanceValidator(schema, allow_import=True,
+                                               import_map={"https://example.com/people.json": external_path})
+    assert validator.validate_instance({"person": {"firstName": "Alice"}}) == []
+    assert [e.code for e in validator.validate_instance({"person": {"firstName": 1}})] == ["EXPECTED_STRING"]
+    assert "$import" in schema and "Person" not in schema
+
+
+# -------------------------------------------------------------------
+# Error Code and Path Tests
+# -------------------------------------------------------------------
+
+
+def test_error_carries_code_and_path():
+    schema = {"type": "string", "$schema": "https://json-structure.org/meta/core/v0/#",
+              "$id": "dummy", "name": "strSchema"}
+    errors = _validate(schema, 123)
+    assert errors == ["Expected string at #, got int"]
+    assert errors[0].code == "EXPECTED_STRING"
+    assert errors[0].path == "#"
+
+
+# -------------------------------------------------------------------
+# Validator Reuse Tests
+# -------------------------------------------------------------------
+
+
+def test_validator_reused_across_instances():
+    schema = {"type": "string", "$schema": "https://json-structure.org/meta/core/v0/#",
+              "$id": "dummy", "name": "strSchema"}
+    validator = JSONStructureInstanceValidator(schema)
+    assert validator.validate_instance(123) == ["Expected string at #, got int"]
+    assert validator.validate_instance("hello") == []
+    assert validator.validate_instance(None) == ["Expected string at #, got NoneType"]
+
+
+# -------------------------------------------------------------------
+# Fail-Fast Tests
+# -------------------------------------------------------------------
+
+
+def test_fail_fast_reports_first_error():
+    schema = {"$schema": "https://json-structure.org/meta/extended/v0/#", "$id": "dummy", "name": "FailFast",
+              "$uses": ["JSONStructureConditionalComposition"],
+              "type": "object", "properties": {"a": {"type": "string"}, "b": {"type": "int32"}},
+              "anyOf": [{"type": "object", "required": ["c"]}, {"type": "object", "required": ["d"]}]}
+    instance = {"a": 1, "b": "2"}
+    errors = JSONStructureInstanceValidator(schema).validate_instance(instance)
+    assert len(errors) > 1
+    assert JSONStructureInstanceValidator(schema, fail_fast=True).validate_instance(instance) == errors[:1]
+    # Composition failures still describe every subschema.
+    errors = JSONStructureInstanceValidator(schema, fail_fast=True).validate_instance({"a": "x"})
+    assert [e.code for e in errors] == ["ANY_OF_MISMATCH"]
+    assert "anyOf[1]" in errors[0]
+
+
+@pytest.mark.parametrize("keyword,value,code", [
+    ("minimum", 10, "MINIMUM"),
+    ("maximum", 1, "MAXIMUM"),
+    ("multipleOf", 3, "MULTIPLE_OF"),
+])
+def test_fail_fast_numeric_constraints(keyword, value, code):
+    """The first constraint error stops validation without a spurious INVALID_CONSTRAINT"""
+    schema = {"$schema": "https://json-structure.org/meta/extended/v0/#", "$id": "dummy", "name": "FailFastNumber",
+              "$uses": ["JSONStructureValidation"], "type": "int32", keyword: value}
+    errors = JSONStructureInstanceValidator(schema, fail_fast=True).validate_instance(5)
+    assert [e.code for e in errors] == [code]
+
+
 # -------------------------------------------------------------------
 # End of comprehensive tests
 # -------------------------------------------------------------------
@@ -738,10 +738,9 @@ def test_valid_schemas(schema):
     Test that valid schemas produce no errors.
     For VALID_ALLOW_DOLLAR, the allow_dollar flag is set.
     """
-    source_text = json.dumps(schema)
     # Enable allow_dollar flag if the schema has a property with a '$' at the start
     allow_dollar = any(key.startswith('$') for key in schema.get("properties", {}))
-    errors = validate_json_structure_schema_core(schema, source_text, allow_dollar=allow_dollar)
+    errors = validate_json_structure_schema_core(schema, allow_dollar=allow_dollar)
     assert errors == []
 
 @pytest.mark.parametrize("schema", VALID_EXTENDED_SCHEMAS)
@@ -749,8 +748,7 @@ def test_valid_extended_schemas(schema):
     """
     Test that valid extended schemas produce no errors when extended=True.
     """
-    source_text = json.dumps(schema)
-    errors = validate_json_structure_schema_core(schema, source_text, extended=True)
+    errors = validate_json_structure_schema_core(schema, extended=True)
     assert errors == []
 
 @pytest.mark.parametrize("schema", INVALID_SCHEMAS)
@@ -758,18 +756,16 @@ def test_invalid_schemas(schema):
     """
     Test that invalid schemas produce one or more errors.
     """
-    source_text = json.dumps(schema)
-    errors = validate_json_structure_schema_core(schema, source_text)
-    assert errors != []
+    errors = validate_json_structure_schema_core(schema, fail_fast=True)
+    assert len(errors) == 1
 
 @pytest.mark.parametrize("schema", INVALID_EXTENDED_SCHEMAS)
 def test_invalid_extended_schemas(schema):
     """
     Test that invalid extended schemas produce one or more errors when extended=True.
     """
-    source_text = json.dumps(schema)
-    errors = validate_json_structure_schema_core(schema, source_text, extended=True)
-    assert errors != []
+    errors = validate_json_structure_schema_core(schema, extended=True, fail_fast=True)
+    assert len(errors) == 1
 
 # Additional test: Check that property names with '$' are rejected when allow_dollar is False.
 def test_dollar_property_rejected():
@@ -782,8 +778,7 @@ def test_dollar_property_rejected():
             "$invalid": {"type": "string"}
         }
     }
-    source_text = json.dumps(schema)
-    errors = validate_json_structure_schema_core(schema, source_text, allow_dollar=False)
+    errors = validate_json_structure_schema_core(schema, allow_dollar=False)
     assert any("does not match" in err for err in errors)
 
 # Additional test: Valid $offers structure.
@@ -803,8 +798,7 @@ def test_valid_offers():
             }
         }
     }
-    source_text = json.dumps(schema)
-    errors = validate_json_structure_schema_core(schema, source_text)
+    errors = validate_json_structure_schema_core(schema)
     assert errors == []
 
 # Test that extended keywords are rejected without extended=True
@@ -817,9 +811,8 @@ def test_extended_keywords_rejected_without_flag():
         "type": "string",
         "minLength": 5
     }
-    source_text = json.dumps(schema)
     # Without extended=True, this should not fail (validator does not check for extension if extended=False)
-    errors = validate_json_structure_schema_core(schema, source_text, extended=False)
+    errors = validate_json_structure_schema_core(schema, extended=False)
     assert errors == []
 
 # Test $uses validation
@@ -832,8 +825,7 @@ def test_uses_validation():
         "$uses": ["JSONStructureValidation", "JSONStructureConditionalComposition"],
         "type": "string"
     }
-    source_text = json.dumps(schema_valid)
-    errors = validate_json_structure_schema_core(schema_valid, source_text, extended=True)
+    errors = validate_json_structure_schema_core(schema_valid, extended=True)
     assert errors == []
     
     # Invalid $uses - not an array
@@ -843,8 +835,7 @@ def test_uses_validation():
         "$uses": "JSONStructureValidation",
         "type": "string"
     }
-    source_text = json.dumps(schema_invalid)
-    errors = validate_json_structure_schema_core(schema_invalid, source_text, extended=True)
+    errors = validate_json_structure_schema_core(schema_invalid, extended=True)
     assert any("$uses must be an array" in err for err in errors)
     
     # Invalid $uses - unknown extension
@@ -854,8 +845,7 @@ def test_uses_validation():
         "$uses": ["UnknownExtension"],
         "type": "string"
     }
-    source_text = json.dumps(schema_unknown)
-    errors = validate_json_structure_schema_core(schema_unknown, source_text, extended=True)
+    errors = validate_json_structure_schema_core(schema_unknown, extended=True)
     assert any("Unknown extension" in err for err in errors)
 
 # Test that validation meta-schema enables extensions by default
@@ -870,8 +860,7 @@ def test_validation_metaschema_enables_extensions():
             {"type": "string", "pattern": "^[A-Z]"}
         ]
     }
-    source_text = json.dumps(schema)
-    errors = validate_json_structure_schema_core(schema, source_text, extended=True)
+    errors = validate_json_structure_schema_core(schema, extended=True)
     assert errors == []
 
 
@@ -896,8 +885,7 @@ def test_all_primitive_types_valid(primitive_type):
         "name": f"{primitive_type.capitalize()}Schema",
         "type": primitive_type
     }
-    source_text = json.dumps(schema)
-    errors = validate_json_structure_schema_core(schema, source_text)
+    errors = validate_json_structure_schema_core(schema)
     assert errors == [], f"Type '{primitive_type}' should be valid but got errors: {errors}"
 
 
@@ -909,8 +897,7 @@ def test_unknown_type_rejected():
         "name": "UnknownTypeSchema",
         "type": "unknowntype"
     }
-    source_text = json.dumps(schema)
-    errors = validate_json_structure_schema_core(schema, source_text)
+    errors = validate_json_structure_schema_core(schema)
     assert any("not a recognized" in err for err in errors)
 
 
@@ -924,8 +911,7 @@ def test_maxlength_valid():
         "type": "string",
         "maxLength": 100
     }
-    source_text = json.dumps(schema)
-    errors = validate_json_structure_schema_core(schema, source_text, extended=True)
+    errors = validate_json_structure_schema_core(schema, extended=True)
     assert errors == []
 
 
@@ -938,8 +924,7 @@ def test_maxlength_negative():
         "type": "string",
         "maxLength": -1
     }
-    source_text = json.dumps(schema)
-    errors = validate_json_structure_schema_core(schema, source_text, extended=True)
+    errors = validate_json_structure_schema_core(schema, extended=True)
     assert any("maxLength" in err for err in errors)
 
 
@@ -952,8 +937,7 @@ def test_maxlength_not_integer():
         "type": "string",
         "maxLength": "100"
     }
-    source_text = json.dumps(schema)
-    errors = validate_json_structure_schema_core(schema, source_text, extended=True)
+    errors = validate_json_structure_schema_core(schema, extended=True)
     assert any("maxLength" in err for err in errors)
 
 
@@ -1011,8 +995,7 @@ def test_compound_types_recognized(compound_type):
             "type": "any"
         }
     
-    source_text = json.dumps(schema)
-    errors = validate_json_structure_schema_core(schema, source_text)
+    errors = validate_json_structure_schema_core(schema)
     assert errors == [], f"Compound type '{compound_type}' should be valid but got errors: {errors}"
 
 
@@ -1032,8 +1015,7 @@ def test_numeric_validation_keywords(numeric_type):
         "minimum": 0,
         "maximum": 100
     }
-    source_text = json.dumps(schema)
-    errors = validate_json_structure_schema_core(schema, source_text, extended=True)
+    errors = validate_json_structure_schema_core(schema, extended=True)
     assert errors == [], f"Numeric validation on '{numeric_type}' should be valid but got errors: {errors}"
 
 
@@ -1050,6 +1032,88 @@ def test_string_numeric_validation_keywords(string_numeric_type):
         "minimum": "0",
         "maximum": "1000000000000"
     }
-    source_text = json.dumps(schema)
-    errors = validate_json_structure_schema_core(schema, source_text, extended=True)
+    errors = validate_json_structure_schema_core(schema, extended=True)
     assert errors == [], f"String-based numeric validation on '{string_numeric_type}' should be valid but got errors: {errors}"
+
+
+def test_results_cached_per_document_and_options():
+    """Test that repeated validation of the same document reuses the result without sharing it."""
+    schema = {
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "https://example.com/schema/cached",
+        "name": "CachedSchema",
+        "type": "object",
+        "properties": {"$meta": {"type": "string"}}
+    }
+    first = validate_json_structure_schema_core(schema)
+    assert first != []
+    first.append("caller-owned")
+    assert validate_json_structure_schema_core(schema) == first[:-1]
+    # The options are part of the cache key.
+    assert validate_json_structure_schema_core(schema, allow_dollar=True) == []
+    # Integer keys must not be confused with their string form.
+    offers_str = {"$schema": "https://json-structure.org/meta/core/v0/#", "$id": "https://example.com/schema/offers",
+                  "name": "Offers", "type": "string", "$offers": {"123": "x"}}
+    offers_int = dict(offers_str, **{"$offers": {123: "x"}})
+    assert validate_json_structure_schema_core(offers_str) != validate_json_structure_schema_core(offers_int)
+
+
+def test_source_text_optional():
+    """Test that omitting source_text reports the same errors as passing the serialized document."""
+    schema = {
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "https://example.com/schema/located",
+        "name": "LocatedSchema",
+        "type": "unknownType"
+    }
+    errors = validate_json_structure_schema_core(schema)
+    assert errors and errors == validate_json_structure_schema_core(schema, json.dumps(schema))
+
+
+def test_deeply_nested_schema_does_not_recurse():
+    """Test that nested schemas are validated iteratively, without hitting the recursion limit."""
+    schema = {
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "https://example.com/schema/deep",
+        "name": "DeepSchema",
+        "type": "array",
+        "items": {"type": "string"}
+    }
+    node = schema
+    for _ in range(3000):
+        node["items"] = {"type": "array", "items": {"type": "string"}}
+        node = node["items"]
+    node["items"] = {"type": "unknownType"}
+    errors = validate_json_structure_schema_core(schema)
+    assert len(errors) == 1 and "unknownType" in errors[0]
+
+
+def test_nested_errors_reported_depth_first():
+    """Test that errors of nested schemas are reported depth first, in document order."""
+    schema = {
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "https://example.com/schema/order",
+        "name": "OrderSchema",
+        "type": "object",
+        "properties": {
+            "p": {"type": "object", "properties": {"q": {"type": "unknownQ"}}},
+            "r": {"type": "unknownR"}
+        }
+    }
+    errors = validate_json_structure_schema_core(schema)
+    assert len(errors) == 2 and "unknownQ" in errors[0] and "unknownR" in errors[1]
+    fail_fast_errors = validate_json_structure_schema_core(schema, fail_fast=True)
+    assert len(fail_fast_errors) == 1 and "unknownQ" in fail_fast_errors[0]
+
+
+def test_fail_fast_reports_first_error():
+    """Test that fail_fast stops at the error a full validation reports first."""
+    schema = {
+        "$schema": "https://json-structure.org/meta/core/v0/#",
+        "$id": "not-absolute",
+        "name": "1Invalid",
+        "type": "unknownType"
+    }
+    errors = validate_json_structure_schema_core(schema)
+    assert len(errors) == 3
+    assert validate_json_structure_schema_core(schema, fail_fast=True) == errors[:1]